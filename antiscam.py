@@ -22,6 +22,12 @@ class AntiScamBot(commands.Bot):
         self.message_history = {}
         self.last_config_reload_at = None
         self.last_keywords_reload_at = None
+        self.app_owner_id = None
+        self.onboard_permissions_applied = {}
+        self.channel_send_buckets = {}
+        self.banned_ids_per_guild = {}
+        self.ban_permission_per_guild = {}
+        self.guild_action_limiters = {}
 
     async def setup_hook(self):
         """This is called once when the bot is setting up, before it logs in."""
@@ -31,6 +37,17 @@ class AntiScamBot(commands.Bot):
         config.logger.info("Database initialized successfully.")
         # <<< END OF FIX >>>
 
+        # Warm the shared keywords cache so the first command/screen doesn't parse the YAML.
+        await data_manager.load_keywords()
+        # Same for fed stats, so the first federated ban doesn't wait on the file read.
+        await data_manager.load_fed_stats()
+
+        try:
+            app_info = await self.application_info()
+            self.app_owner_id = app_info.owner.id
+        except Exception as e:
+            config.logger.warning(f"Could not cache application owner at startup, will retry on first check: {e}")
+
         for filename in os.listdir(config.COGS_DIR):
             if filename.endswith('.py'):
                 try:
@@ -46,6 +63,11 @@ class AntiScamBot(commands.Bot):
         except Exception as e:
             config.logger.error(f"Failed to sync application commands: {e}")
 
+    async def close(self):
+        await data_manager.flush_keywords()
+        await data_manager.flush_fed_stats()
+        await super().close()
+
 
 # --- MAIN SCRIPT EXECUTION ---
 if __name__ == "__main__":
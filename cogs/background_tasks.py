@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 from config import logger
 import data_manager
+import screening_handler
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
@@ -215,6 +216,7 @@ class BackgroundTasks(commands.Cog):
                 self.bot.last_config_reload_at = datetime.now(timezone.utc)
             if before_state["keywords"]["mtime"] != after_state["keywords"]["mtime"]:
                 self.bot.last_keywords_reload_at = datetime.now(timezone.utc)
+                screening_handler.pattern_registry.rebuild(keywords_data)
         except Exception as e:
             logger.error(f"CONFIG REFRESH: Failed to reload config/keywords: {e}", exc_info=True)
 
@@ -11,9 +11,9 @@ import data_manager
 import llm_handler
 import screening_handler
 from config import logger
-from ui.views import ScreeningView, FederatedAlertView, FederatedUnbanAlertView
+from ui.views import ScreeningView, FederatedAlertView, FederatedUnbanAlertView, LookupPaginatorView
 from utils.helpers import get_timeout_minutes_for_guild
-from utils.federation_handler import process_federated_ban, process_federated_unban
+from utils.federation_handler import process_federated_ban, process_federated_unban, restart_ban_cache, note_ban_change
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
@@ -35,18 +35,37 @@ class EventListeners(commands.Cog):
         self.bot.add_view(ScreeningView())
         self.bot.add_view(FederatedAlertView())
         self.bot.add_view(FederatedUnbanAlertView())
+        self.bot.add_view(LookupPaginatorView())
 
         keywords_data = await data_manager.load_keywords()
         if keywords_data:
             self.bot.suspicious_identity_tags = keywords_data.get("global_keywords", {}).get("suspicious_identity_tags", [])
+            screening_handler.pattern_registry.rebuild(keywords_data)
         
         logger.info(f"Loaded {len(self.bot.suspicious_identity_tags)} suspicious identity tags.")
         logger.info(f"Loaded {len(self.bot.scam_server_ids)} known scam server IDs.")
 
+        # on_ready can fire again after a reconnect, and ban events missed meanwhile are never replayed,
+        # so every cached ban list is dropped and read again.
+        restart_ban_cache(self.bot)
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild):
         logger.info(f"Joined new guild: {guild.name} ({guild.id}). Setting up command permissions.")
 
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.bot.ban_permission_per_guild.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.bot.ban_permission_per_guild.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if after.id == self.bot.user.id and before.roles != after.roles:
+            self.bot.ban_permission_per_guild.pop(after.guild.id, None)
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         config = self.bot.config
@@ -55,7 +74,7 @@ class EventListeners(commands.Cog):
             logger.info(f"Bot owner ({member.name}) joined {member.guild.name}. Skipping screening.")
             return
 
-        if member.guild.id not in config.get("federated_guild_ids", []):
+        if member.guild.id not in config.get("federated_guild_id_set", frozenset()):
             return
     
         await asyncio.sleep(2)
@@ -145,7 +164,7 @@ class EventListeners(commands.Cog):
         if bot_owner_id and message.author.id == bot_owner_id:
             return
     
-        if not message.guild or message.guild.id not in config.get("federated_guild_ids", []):
+        if not message.guild or message.guild.id not in config.get("federated_guild_id_set", frozenset()):
             return
         if not isinstance(message.author, discord.Member):
             return
@@ -301,8 +320,9 @@ class EventListeners(commands.Cog):
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User):
         config = self.bot.config
-        if guild.id not in config.get("federated_guild_ids", []):
+        if guild.id not in config.get("federated_guild_id_set", frozenset()):
             return
+        note_ban_change(self.bot, guild.id, user.id, True)
     
         await asyncio.sleep(2) # Wait for audit log
         try:
@@ -355,8 +375,9 @@ class EventListeners(commands.Cog):
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User):
         config = self.bot.config
-        if guild.id not in config.get("federated_guild_ids", []):
+        if guild.id not in config.get("federated_guild_id_set", frozenset()):
             return
+        note_ban_change(self.bot, guild.id, user.id, False)
 
         await asyncio.sleep(2)
         try:
@@ -11,6 +11,7 @@ import data_manager
 import screening_handler
 from ui.views import ConfirmScanView, RegexTestModal, OnboardView, ConfirmGlobalBanView, AlreadyBannedView, ConfirmGlobalUnbanView, LookupPaginatorView, TestCurrentRegexModal, ConfirmMassBanView, ConfirmMassKickView, ConfirmRegexEditView
 from utils.checks import has_mod_role, has_federated_mod_role, is_federated_moderator
+from utils.helpers import truncate_audit_reason
 from utils.command_helpers import (
     format_keyword_list, add_keyword_to_list, add_regex_to_list,
     remove_keyword_from_list, remove_regex_from_list_by_id
@@ -47,7 +48,7 @@ class ModCommands(commands.Cog):
     ) -> tuple[int, list[str]]:
         success_count = 0
         unbanned_guilds: list[str] = []
-        audit_reason = f"[Whitelist] Unbanned by {moderator.name} after whitelist add."
+        audit_reason = truncate_audit_reason(f"[Whitelist] Unbanned by {moderator.name} after whitelist add.")
 
         for guild_id in self.bot.config.get("federated_guild_ids", []):
             guild = self.bot.get_guild(guild_id)
@@ -66,7 +67,7 @@ class ModCommands(commands.Cog):
                 continue
 
             try:
-                await guild.unban(user_to_unban, reason=audit_reason[:512])
+                await guild.unban(user_to_unban, reason=audit_reason)
                 success_count += 1
                 unbanned_guilds.append(guild.name)
             except discord.Forbidden:
@@ -365,10 +366,9 @@ class ModCommands(commands.Cog):
             )
             return
 
-        # This might be heavy with 60k users, but necessary for the current OnboardView logic.
-        # Future improvement: Stream this in chunks inside the View.
-        all_bans = await data_manager.db_get_all_bans()
-        ban_count = len(all_bans)
+        # Only user IDs and reasons are needed, loaded as parallel columns to keep 60k+ bans compact.
+        fed_bans = await data_manager.db_get_onboard_bans()
+        ban_count = len(fed_bans.user_ids)
 
         if ban_count == 0:
             await interaction.response.send_message("ℹ️ The federated ban list is currently empty. No onboarding action is needed.", ephemeral=True)
@@ -433,7 +433,7 @@ class ModCommands(commands.Cog):
         )
         welcome_embed.set_footer(text="❗️ This cannot be undone.")
 
-        view = OnboardView(self.bot, interaction.user, all_bans)
+        view = OnboardView(self.bot, interaction.user, fed_bans)
         await interaction.response.send_message(embed=welcome_embed, view=view)
 
     @app_commands.command(name="mass-kick", description="Kicks multiple users from THIS SERVER by ID.")
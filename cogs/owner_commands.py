@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 import config as app_config
 import data_manager
+import screening_handler
 from utils.checks import is_bot_owner
 from utils.command_helpers import (
     add_global_keyword_to_list, remove_global_keyword_from_list,
@@ -20,7 +21,7 @@ from ui.views import AnnouncementModal, ConfirmRegexEditView
 
 
 import asyncio
-from utils.helpers import get_delete_days_for_guild
+from utils.helpers import get_delete_seconds_for_guild
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
@@ -132,12 +133,13 @@ class OwnerCommands(commands.Cog):
         before_state = data_manager.get_cache_state()
 
         self.bot.config = data_manager.load_federation_config()
-        keywords_data = await data_manager.load_keywords()
+        keywords_data = await data_manager.load_keywords(force_refresh=True)
         self.bot.scam_server_ids = data_manager.load_scam_servers()
         self.bot.system_prompt = data_manager.load_system_prompt()
 
         if keywords_data:
             self.bot.suspicious_identity_tags = keywords_data.get("global_keywords", {}).get("suspicious_identity_tags", [])
+            screening_handler.pattern_registry.rebuild(keywords_data)
 
         if not self.bot.config or keywords_data is None:
             await interaction.followup.send("❌ **Failed to reload.** Check logs for errors with config or keyword files.")
@@ -562,7 +564,7 @@ class OwnerCommands(commands.Cog):
                 logger.warning(f"Sync: Found missing ban for user {user_id_str} in origin guild {origin_guild.name}. Applying now.")
                 try:
                     reason = f"[SYNC ACTION] Applying missing ban from original command. Original reason: {ban_data.get('reason', 'N/A')}"
-                    delete_seconds = get_delete_days_for_guild(self.bot, origin_guild) * 86400
+                    delete_seconds = get_delete_seconds_for_guild(self.bot, origin_guild)
                     await origin_guild.ban(user_obj, reason=reason[:512], delete_message_seconds=delete_seconds)
                     missing_bans_applied += 1
                 except Exception as e:
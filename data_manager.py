@@ -1,10 +1,17 @@
 # /antiscam/data_manager.py
 
 import os
+import copy
 import json
+import time
+import asyncio
 import logging
+import tempfile
+import threading
 import aiosqlite
-from typing import Optional
+from array import array
+from collections import Counter, defaultdict
+from typing import Optional, NamedTuple
 
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
@@ -29,10 +36,11 @@ from config import (
 logger = logging.getLogger()
 DB_FILE = os.path.join(DATA_DIR, "antiscam.db")
 
-_yaml = YAML()
-_yaml.preserve_quotes = True
-_yaml.indent(mapping=2, sequence=4, offset=2)
-_yaml.width = 120
+# YAML instances are not thread-safe and keyword I/O runs in worker threads, so each thread gets its own.
+_yaml_local = threading.local()
+# Held for every read-modify-write of a config YAML file, including the final rename,
+# so concurrent writers (keyword saves, whitelist edits) can't overwrite each other's changes.
+_config_write_lock = threading.Lock()
 
 # --- IN-MEMORY CACHES ---
 _config_cache: Optional[dict] = None
@@ -41,6 +49,19 @@ _config_cache_mtime: Optional[float] = None
 _keywords_cache_mtime: Optional[float] = None
 _config_cache_source: Optional[str] = None
 _keywords_cache_source: Optional[str] = None
+# Monotonic time of the last mtime check; within the TTL the cached keywords
+# are returned without walking the YAML directory.
+_keywords_cache_checked_at: Optional[float] = None
+KEYWORDS_CACHE_TTL_SECONDS = 5.0
+# Keyword edits are written back after this delay so a burst of edits costs one write.
+KEYWORDS_FLUSH_DELAY_SECONDS = 1.0
+_pending_keywords: Optional[dict] = None
+_keywords_flush_task: Optional[asyncio.Task] = None
+# Federation stats live in memory after the first load; changes are written back after this delay.
+FED_STATS_FLUSH_DELAY_SECONDS = 2.0
+_fed_stats_cache: Optional[dict] = None
+_fed_stats_dirty = False
+_fed_stats_flush_task: Optional[asyncio.Task] = None
 
 # --- YAML + VALIDATION MODELS ---
 class LlmSettingsModel(BaseModel):
@@ -113,11 +134,22 @@ class ServerConfigModel(BaseModel):
 
 # --- YAML HELPERS ---
 
+def _get_yaml() -> YAML:
+    yaml = getattr(_yaml_local, "yaml", None)
+    if yaml is None:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        yaml.indent(mapping=2, sequence=4, offset=2)
+        yaml.width = 120
+        _yaml_local.yaml = yaml
+    return yaml
+
+
 def _read_yaml(path: str) -> Optional[CommentedMap]:
     if not os.path.exists(path):
         return None
     with open(path, 'r', encoding='utf-8') as f:
-        data = _yaml.load(f)
+        data = _get_yaml().load(f)
     if data is None:
         return CommentedMap()
     return data
@@ -125,8 +157,45 @@ def _read_yaml(path: str) -> Optional[CommentedMap]:
 
 def _write_yaml(path: str, data: CommentedMap) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        _yaml.dump(data, f)
+    # Write to a uniquely named sibling temp file and swap it in so readers never see a half-written config.
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            _get_yaml().dump(data, f)
+        except BaseException:
+            f.close()
+            os.remove(tmp_path)
+            raise
+    # The temp file is created 0600; keep the config's existing permissions.
+    try:
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+    except FileNotFoundError:
+        os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return None
+
+
+def _write_json(path: str, data) -> None:
+    _write_text(path, json.dumps(data, indent=4))
+
+
+def _write_text(path: str, text: str) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        # Make the new contents durable before the rename, or a crash can leave an empty file behind.
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 def ensure_runtime_dirs() -> None:
@@ -206,6 +275,76 @@ def _load_legacy_json(path: str) -> Optional[dict]:
             return None
 
 
+def _read_keywords_from_disk() -> tuple[Optional[dict], str]:
+    """Blocking YAML (or legacy JSON) read of every keyword ruleset. Run in a worker thread."""
+    global_model = _load_global_yaml()
+
+    if global_model is None:
+        legacy = _load_legacy_json(LEGACY_KEYWORDS_FILE)
+        if legacy is not None:
+            logger.warning("Loaded legacy keywords JSON. Migrate to YAML for full functionality.")
+            return legacy, "legacy"
+        logger.error("Global keywords YAML not found or invalid, and no legacy JSON available.")
+        return None, "yaml"
+
+    keywords_data = {
+        "server_name_to_id": global_model.server_name_to_id or {},
+        "global_keywords": _global_keywords_to_dict(global_model.global_keywords),
+        "per_server_keywords": {},
+    }
+
+    for server in _load_server_configs():
+        guild_id_str = str(server.guild_id)
+        keywords_data["per_server_keywords"][guild_id_str] = _keyword_ruleset_to_dict(server.keywords)
+
+    return keywords_data, "yaml"
+
+
+def _write_keywords_to_disk(keywords_data: dict) -> str:
+    """Blocking write of every keyword ruleset. Run in a worker thread. Returns the storage format used."""
+    with _config_write_lock:
+        # If YAML config doesn't exist yet, fall back to legacy JSON to avoid data loss.
+        if not os.path.exists(GLOBAL_CONFIG_FILE) and os.path.exists(LEGACY_KEYWORDS_FILE):
+            _write_json(LEGACY_KEYWORDS_FILE, keywords_data)
+            logger.warning("Saved keywords to legacy JSON because YAML config is missing.")
+            return "legacy"
+
+        global_yaml = _read_yaml(GLOBAL_CONFIG_FILE) or CommentedMap()
+        global_yaml["global_keywords"] = keywords_data.get("global_keywords", {})
+
+        if "server_name_to_id" in keywords_data:
+            global_yaml["server_name_to_id"] = keywords_data.get("server_name_to_id", {})
+
+        _write_yaml(GLOBAL_CONFIG_FILE, global_yaml)
+
+        per_server = keywords_data.get("per_server_keywords", {})
+        for guild_id_str, ruleset in per_server.items():
+            server_path = os.path.join(SERVERS_CONFIG_DIR, f"{guild_id_str}.yaml")
+            server_yaml = _read_yaml(server_path) or CommentedMap()
+            server_yaml["guild_id"] = int(guild_id_str)
+            server_yaml["keywords"] = ruleset
+            _write_yaml(server_path, server_yaml)
+
+        return "yaml"
+
+
+def _write_whitelisted_user_id_to_disk(user_id: int, whitelisted: bool) -> bool:
+    """Blocking add/remove of one ID in the global whitelist. Run in a worker thread. Returns False if nothing changed."""
+    with _config_write_lock:
+        global_yaml = _read_yaml(GLOBAL_CONFIG_FILE) or CommentedMap()
+        whitelist = list(global_yaml.get("whitelisted_user_ids", []))
+        if (user_id in whitelist) == whitelisted:
+            return False
+        if whitelisted:
+            whitelist.append(user_id)
+            whitelist.sort()
+        else:
+            whitelist.remove(user_id)
+        global_yaml["whitelisted_user_ids"] = whitelist
+        _write_yaml(GLOBAL_CONFIG_FILE, global_yaml)
+        return True
+
+
 def _keyword_ruleset_to_dict(ruleset: KeywordRulesetModel) -> dict:
     data = _model_dump(ruleset)
     # Ensure optional keys exist
@@ -332,6 +471,59 @@ def is_user_whitelisted(user_id: int | str, config: Optional[dict] = None) -> bo
 
 # --- CONFIG & KEYWORDS ---
 
+def _add_moderator_role_sets(config: dict) -> None:
+    """Precomputes frozensets of moderator role IDs so permission checks avoid list scans."""
+    role_sets = {
+        guild_id_str: frozenset(int(role_id) for role_id in role_ids)
+        for guild_id_str, role_ids in config.get("moderator_roles_per_guild", {}).items()
+    }
+    config["moderator_role_sets_per_guild"] = role_sets
+    config["all_moderator_role_ids"] = frozenset().union(*role_sets.values())
+
+
+def _add_delete_seconds(config: dict) -> None:
+    """Precomputes delete_message_seconds per guild (int guild ID) so ban paths skip the days lookup and math."""
+    config["delete_message_seconds_per_guild"] = {
+        int(guild_id_str): int(days) * 86400
+        for guild_id_str, days in config.get("delete_messages_on_ban_days_per_guild", {}).items()
+    }
+    config["delete_message_seconds_default"] = int(config.get("delete_messages_on_ban_days_default", 1)) * 86400
+
+
+def _add_timeout_minutes(config: dict) -> None:
+    """Precomputes timeout minutes per guild (int guild ID) so screening paths skip the str(guild.id) lookup."""
+    config["timeout_minutes_per_guild"] = {
+        int(guild_id_str): int(minutes)
+        for guild_id_str, minutes in config.get("timeout_duration_minutes_per_guild", {}).items()
+    }
+
+
+def _add_federated_guild_set(config: dict) -> None:
+    """Precomputes a frozenset of federated guild IDs for the per-event membership checks."""
+    config["federated_guild_id_set"] = frozenset(int(guild_id) for guild_id in config.get("federated_guild_ids", []))
+
+
+def _add_announcement_channel_sets(config: dict) -> None:
+    """Precomputes each guild's unique announcement channels (alert + notice), keyed by int guild ID."""
+    channel_sets: dict[int, set[int]] = {}
+    for key in ("action_alert_channels", "federation_notice_channels"):
+        for guild_id_str, channel_id in config.get(key, {}).items():
+            if channel_id:
+                channel_sets.setdefault(int(guild_id_str), set()).add(int(channel_id))
+    config["announcement_channels_per_guild"] = {
+        guild_id: frozenset(channel_ids) for guild_id, channel_ids in channel_sets.items()
+    }
+
+
+def _add_notice_channel_ids(config: dict) -> None:
+    """Precomputes each guild's federation notice channel, keyed by int guild ID, for propagation."""
+    config["federation_notice_channel_per_guild"] = {
+        int(guild_id_str): int(channel_id)
+        for guild_id_str, channel_id in config.get("federation_notice_channels", {}).items()
+        if channel_id
+    }
+
+
 def load_federation_config():
     ensure_runtime_dirs()
     global _config_cache, _config_cache_mtime
@@ -346,6 +538,12 @@ def load_federation_config():
         legacy = _load_legacy_json(LEGACY_CONFIG_FILE)
         if legacy is not None:
             logger.warning("Loaded legacy config JSON. Migrate to YAML for full functionality.")
+            _add_moderator_role_sets(legacy)
+            _add_federated_guild_set(legacy)
+            _add_delete_seconds(legacy)
+            _add_timeout_minutes(legacy)
+            _add_announcement_channel_sets(legacy)
+            _add_notice_channel_ids(legacy)
             _config_cache = legacy
             _config_cache_mtime = _legacy_mtime(LEGACY_CONFIG_FILE)
             global _config_cache_source
@@ -410,6 +608,13 @@ def load_federation_config():
         if server.llm_settings:
             config["llm_settings"]["per_guild_settings"][guild_id_str] = _model_dump(server.llm_settings)
 
+    _add_moderator_role_sets(config)
+    _add_federated_guild_set(config)
+    _add_delete_seconds(config)
+    _add_timeout_minutes(config)
+    _add_announcement_channel_sets(config)
+    _add_notice_channel_ids(config)
+
     _config_cache = config
     _config_cache_mtime = yaml_mtime
     _config_cache_source = "yaml"
@@ -421,14 +626,8 @@ async def add_whitelisted_user_id(user_id: int | str) -> bool:
     async with config_lock:
         ensure_runtime_dirs()
         global _config_cache, _config_cache_mtime, _config_cache_source
-        global_yaml = _read_yaml(GLOBAL_CONFIG_FILE) or CommentedMap()
-        whitelist = list(global_yaml.get("whitelisted_user_ids", []))
-        if normalized_id in whitelist:
+        if not await asyncio.to_thread(_write_whitelisted_user_id_to_disk, normalized_id, True):
             return False
-        whitelist.append(normalized_id)
-        whitelist.sort()
-        global_yaml["whitelisted_user_ids"] = whitelist
-        _write_yaml(GLOBAL_CONFIG_FILE, global_yaml)
         _config_cache = None
         _config_cache_mtime = None
         _config_cache_source = None
@@ -442,13 +641,8 @@ async def remove_whitelisted_user_id(user_id: int | str) -> bool:
     async with config_lock:
         ensure_runtime_dirs()
         global _config_cache, _config_cache_mtime, _config_cache_source
-        global_yaml = _read_yaml(GLOBAL_CONFIG_FILE) or CommentedMap()
-        whitelist = list(global_yaml.get("whitelisted_user_ids", []))
-        if normalized_id not in whitelist:
+        if not await asyncio.to_thread(_write_whitelisted_user_id_to_disk, normalized_id, False):
             return False
-        whitelist.remove(normalized_id)
-        global_yaml["whitelisted_user_ids"] = whitelist
-        _write_yaml(GLOBAL_CONFIG_FILE, global_yaml)
         _config_cache = None
         _config_cache_mtime = None
         _config_cache_source = None
@@ -469,108 +663,182 @@ def load_scam_servers() -> list[int]:
 
 async def load_sync_status():
     async with sync_status_lock:
-        if not os.path.exists(SYNC_STATUS_FILE):
-            return {"synced_guild_ids": []}
-        with open(SYNC_STATUS_FILE, 'r', encoding='utf-8') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {"synced_guild_ids": []}
+        data = await asyncio.to_thread(_read_json, SYNC_STATUS_FILE)
+        return data if data is not None else {"synced_guild_ids": []}
 
 async def save_sync_status(data: dict):
     async with sync_status_lock:
         ensure_runtime_dirs()
-        with open(SYNC_STATUS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        await asyncio.to_thread(_write_json, SYNC_STATUS_FILE, data)
+
+def _fed_stats_with_counters(data: dict) -> defaultdict:
+    """
+    Wraps loaded stats so counters can be bumped in place: stats[section][counter] += 1.
+    Missing sections are created on first write; missing counts read as 0 without being inserted.
+    """
+    stats = defaultdict(Counter)
+    for section_key, section in data.items():
+        if not isinstance(section, dict):
+            stats[section_key] = section
+            continue
+        stats[section_key] = Counter({
+            name: Counter(value) if isinstance(value, dict) else value
+            for name, value in section.items()
+        })
+    return stats
 
 async def load_fed_stats():
+    """
+    Returns the shared in-memory stats, reading the file only on first use.
+    Callers mutate it in place and call mark_fed_stats_dirty().
+    """
+    global _fed_stats_cache
+    if _fed_stats_cache is not None:
+        return _fed_stats_cache
     async with stats_lock:
-        if os.path.exists(FED_STATS_FILE):
-            with open(FED_STATS_FILE, 'r') as f:
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError:
-                    return {}
-        return {}
+        if _fed_stats_cache is None:
+            data = await asyncio.to_thread(_read_json, FED_STATS_FILE)
+            _fed_stats_cache = _fed_stats_with_counters(data or {})
+        return _fed_stats_cache
 
 async def save_fed_stats(data: dict):
+    global _fed_stats_cache
     async with stats_lock:
         ensure_runtime_dirs()
-        with open(FED_STATS_FILE, 'w') as f:
-            json.dump(data, f, indent=4)
+        _fed_stats_cache = data
+        # Serialize on the loop: the dict is shared and may change while the file is being written.
+        payload = json.dumps(data, indent=4)
+        await asyncio.to_thread(_write_text, FED_STATS_FILE, payload)
+
+def mark_fed_stats_dirty() -> None:
+    """Schedules a debounced write of the in-memory stats, so a burst of federated actions costs one write."""
+    global _fed_stats_dirty, _fed_stats_flush_task
+    _fed_stats_dirty = True
+    if _fed_stats_flush_task is None or _fed_stats_flush_task.done():
+        _fed_stats_flush_task = asyncio.create_task(_flush_fed_stats_later())
+
+async def _flush_fed_stats_later():
+    global _fed_stats_flush_task
+    await asyncio.sleep(FED_STATS_FLUSH_DELAY_SECONDS)
+    # Actions that land while a write is in flight see this task still running and schedule nothing,
+    # so keep writing until no changes are left.
+    while _fed_stats_dirty and _fed_stats_cache is not None:
+        if not await _write_pending_fed_stats():
+            # The changes are still marked dirty; try again after another delay instead of spinning.
+            _fed_stats_flush_task = asyncio.create_task(_flush_fed_stats_later())
+            return
+
+async def _write_pending_fed_stats() -> bool:
+    """Writes the stats if they have unsaved changes. Returns False if the write failed; they stay dirty."""
+    global _fed_stats_dirty
+    if not _fed_stats_dirty or _fed_stats_cache is None:
+        return True
+    _fed_stats_dirty = False
+    try:
+        await save_fed_stats(_fed_stats_cache)
+    except Exception as e:
+        _fed_stats_dirty = True
+        logger.error(f"Failed to write pending fed stats: {e}", exc_info=True)
+        return False
+    return True
+
+async def flush_fed_stats() -> None:
+    """Writes pending stats changes to disk now, after any write already in flight. Call on shutdown."""
+    task = _fed_stats_flush_task
+    if task is not None and not task.done() and task is not asyncio.current_task():
+        await task
+    await _write_pending_fed_stats()
+
+async def load_keywords(force_refresh: bool = False):
+    global _keywords_cache, _keywords_cache_mtime, _keywords_cache_checked_at
+    if (
+        not force_refresh
+        and _keywords_cache is not None
+        and _keywords_cache_checked_at is not None
+        and time.monotonic() - _keywords_cache_checked_at < KEYWORDS_CACHE_TTL_SECONDS
+    ):
+        return _keywords_cache
 
-async def load_keywords():
     async with keywords_lock:
         ensure_runtime_dirs()
-        global _keywords_cache, _keywords_cache_mtime
         yaml_mtime = _compute_yaml_mtime()
+        _keywords_cache_checked_at = time.monotonic()
         if _keywords_cache is not None and yaml_mtime is not None and _keywords_cache_mtime == yaml_mtime:
             return _keywords_cache
 
-        global_model = _load_global_yaml()
-        server_models = _load_server_configs()
-
-        if global_model is None:
-            legacy = _load_legacy_json(LEGACY_KEYWORDS_FILE)
-            if legacy is not None:
-                logger.warning("Loaded legacy keywords JSON. Migrate to YAML for full functionality.")
-                _keywords_cache = legacy
-                _keywords_cache_mtime = _legacy_mtime(LEGACY_KEYWORDS_FILE)
-                global _keywords_cache_source
-                _keywords_cache_source = "legacy"
-                return legacy
-            logger.error("Global keywords YAML not found or invalid, and no legacy JSON available.")
+        # YAML parsing and validation are slow enough on large configs to stall the gateway heartbeat.
+        keywords_data, source = await asyncio.to_thread(_read_keywords_from_disk)
+        if keywords_data is None:
             return None
 
-        keywords_data = {
-            "server_name_to_id": global_model.server_name_to_id or {},
-            "global_keywords": _global_keywords_to_dict(global_model.global_keywords),
-            "per_server_keywords": {},
-        }
-
-        for server in server_models:
-            guild_id_str = str(server.guild_id)
-            keywords_data["per_server_keywords"][guild_id_str] = _keyword_ruleset_to_dict(server.keywords)
-
+        global _keywords_cache_source
         _keywords_cache = keywords_data
-        _keywords_cache_mtime = yaml_mtime
-        _keywords_cache_source = "yaml"
+        _keywords_cache_mtime = yaml_mtime if source == "yaml" else _legacy_mtime(LEGACY_KEYWORDS_FILE)
+        _keywords_cache_source = source
         return keywords_data
 
 async def save_keywords(keywords_data: dict):
     async with keywords_lock:
         ensure_runtime_dirs()
-        global _keywords_cache, _keywords_cache_mtime
-        # If YAML config doesn't exist yet, fall back to legacy JSON to avoid data loss.
-        if not os.path.exists(GLOBAL_CONFIG_FILE) and os.path.exists(LEGACY_KEYWORDS_FILE):
-            with open(LEGACY_KEYWORDS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(keywords_data, f, indent=4)
-            logger.warning("Saved keywords to legacy JSON because YAML config is missing.")
-            _keywords_cache = keywords_data
+        global _keywords_cache, _keywords_cache_mtime, _keywords_cache_checked_at, _keywords_cache_source
+        # Snapshot on the loop: commands keep editing the live dict while the thread writes it out.
+        snapshot = copy.deepcopy(keywords_data)
+        source = await asyncio.to_thread(_write_keywords_to_disk, snapshot)
+
+        _keywords_cache = keywords_data
+        if source == "legacy":
             _keywords_cache_mtime = _legacy_mtime(LEGACY_KEYWORDS_FILE)
-            global _keywords_cache_source
-            _keywords_cache_source = "legacy"
+        else:
+            _keywords_cache_mtime = _compute_yaml_mtime()
+        _keywords_cache_checked_at = time.monotonic()
+        _keywords_cache_source = source
+
+
+def mark_keywords_dirty(keywords_data: dict) -> None:
+    """Updates the in-memory keywords immediately and schedules a debounced write to disk."""
+    global _keywords_cache, _keywords_cache_checked_at, _pending_keywords, _keywords_flush_task
+    _keywords_cache = keywords_data
+    _keywords_cache_checked_at = time.monotonic()
+    _pending_keywords = keywords_data
+    if _keywords_flush_task is None or _keywords_flush_task.done():
+        _keywords_flush_task = asyncio.create_task(_flush_keywords_later())
+
+
+async def _flush_keywords_later():
+    global _keywords_flush_task
+    await asyncio.sleep(KEYWORDS_FLUSH_DELAY_SECONDS)
+    # Edits made while a save is in flight see this task still running and schedule nothing,
+    # so keep saving until none are left.
+    while _pending_keywords is not None:
+        if not await _write_pending_keywords():
+            # The edits are pending again; try again after another delay instead of spinning.
+            _keywords_flush_task = asyncio.create_task(_flush_keywords_later())
             return
 
-        global_yaml = _read_yaml(GLOBAL_CONFIG_FILE) or CommentedMap()
-        global_yaml["global_keywords"] = keywords_data.get("global_keywords", {})
-
-        if "server_name_to_id" in keywords_data:
-            global_yaml["server_name_to_id"] = keywords_data.get("server_name_to_id", {})
 
-        _write_yaml(GLOBAL_CONFIG_FILE, global_yaml)
+async def _write_pending_keywords() -> bool:
+    """Saves the pending keyword edits, if any. Returns False if the save failed; the edits stay pending."""
+    global _pending_keywords
+    if _pending_keywords is None:
+        return True
+    keywords_data, _pending_keywords = _pending_keywords, None
+    try:
+        await save_keywords(keywords_data)
+    except Exception as e:
+        # Put the edits back unless newer ones arrived in the meantime (those include these).
+        if _pending_keywords is None:
+            _pending_keywords = keywords_data
+        logger.error(f"Failed to write pending keyword edits: {e}", exc_info=True)
+        return False
+    return True
 
-        per_server = keywords_data.get("per_server_keywords", {})
-        for guild_id_str, ruleset in per_server.items():
-            server_path = os.path.join(SERVERS_CONFIG_DIR, f"{guild_id_str}.yaml")
-            server_yaml = _read_yaml(server_path) or CommentedMap()
-            server_yaml["guild_id"] = int(guild_id_str)
-            server_yaml["keywords"] = ruleset
-            _write_yaml(server_path, server_yaml)
 
-        _keywords_cache = keywords_data
-        _keywords_cache_mtime = _compute_yaml_mtime()
-        _keywords_cache_source = "yaml"
+async def flush_keywords() -> None:
+    """Writes any pending keyword edits to disk now, after any save already in flight. Call on shutdown."""
+    task = _keywords_flush_task
+    if task is not None and not task.done() and task is not asyncio.current_task():
+        await task
+    await _write_pending_keywords()
 
 
 def get_cache_state() -> dict:
@@ -613,6 +881,23 @@ async def db_search_bans(query: str):
             rows = await cursor.fetchall()
             return [(row['user_id'], dict(row)) for row in rows]
 
+class FedBanColumns(NamedTuple):
+    """Column-oriented view of the ban list: parallel arrays indexed by position."""
+    user_ids: array
+    reasons: list[str]
+
+
+async def db_get_onboard_bans() -> FedBanColumns:
+    """Fetches only what onboarding needs for every ban, as compact parallel columns."""
+    user_ids = array('q')
+    reasons: list[str] = []
+    async with aiosqlite.connect(DB_FILE) as db:
+        async with db.execute("SELECT user_id, COALESCE(reason, 'N/A') FROM bans") as cursor:
+            async for user_id, reason in cursor:
+                user_ids.append(int(user_id))
+                reasons.append(reason)
+    return FedBanColumns(user_ids, reasons)
+
 async def db_get_all_bans():
     """Fetches ALL bans. Use carefully for Onboarding. Returns dict {id: data}."""
     async with aiosqlite.connect(DB_FILE) as db:
@@ -10,6 +10,7 @@ import asyncio
 from typing import Optional, TYPE_CHECKING
 
 from config import logger
+from utils.federation_handler import process_federated_ban
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
@@ -79,8 +80,8 @@ async def perform_automated_action(bot: 'AntiScamBot', alert_message: discord.Me
     """
     Performs the automated action (ban or ignore) after the delay.
     """
+    # ui.views -> screening_handler -> llm_handler, so this one can't move to module scope.
     from ui.views import ScreeningView
-    from utils.federation_handler import process_federated_ban
     
     guild = alert_message.guild
     try:
@@ -2,6 +2,7 @@
 
 import os
 import re
+import functools
 import aiohttp
 import asyncio
 import discord
@@ -10,7 +11,7 @@ from datetime import datetime, timezone, timedelta
 from unidecode import unidecode
 from typing import TYPE_CHECKING
 
-from utils.helpers import get_timeout_minutes_for_guild, get_delete_days_for_guild, truncate_audit_reason
+from utils.helpers import get_timeout_minutes_for_guild, get_delete_seconds_for_guild, truncate_audit_reason
 import data_manager
 from config import logger
 import llm_handler
@@ -358,6 +359,64 @@ async def screen_bio(bot: 'AntiScamBot', member: discord.Member, keywords_data:
     return {"flagged": False}
 
 # --- SCREENING HELPERS ---
+def _compile_or_none(pattern: str) -> re.Pattern | None:
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        logger.warning(f"Invalid regex pattern encountered during screening: '{pattern}' - {e}")
+        return None
+
+
+# Whitelist alternations and smart-keyword patterns are derived from the keyword lists, so every edit
+# produces new ones that rebuild() never sees. They get a bounded cache instead of the registry.
+@functools.lru_cache(maxsize=1024)
+def _get_derived_pattern(pattern: str) -> re.Pattern | None:
+    return _compile_or_none(pattern)
+
+
+class PatternRegistry:
+    """
+    Long-lived cache of compiled regex patterns, keyed by pattern source.
+    Patterns are compiled once (at startup/reload or on first use) instead of on every screen.
+    Invalid patterns are stored as None so they are only reported once.
+    """
+    def __init__(self):
+        self._compiled: dict[str, re.Pattern | None] = {}
+
+    def get(self, pattern: str) -> re.Pattern | None:
+        try:
+            return self._compiled[pattern]
+        except KeyError:
+            pass
+        compiled = _compile_or_none(pattern)
+        self._compiled[pattern] = compiled
+        return compiled
+
+    def remember(self, pattern: str, compiled: re.Pattern) -> None:
+        """Stores a pattern that was already compiled (e.g. while validating a moderator's input)."""
+        self._compiled[pattern] = compiled
+
+    def discard(self, pattern: str) -> None:
+        self._compiled.pop(pattern, None)
+
+    def rebuild(self, keywords_data: dict | None) -> None:
+        """Recompiles every configured regex pattern and drops patterns that were removed."""
+        rulesets = [(keywords_data or {}).get("global_keywords", {})]
+        rulesets.extend((keywords_data or {}).get("per_server_keywords", {}).values())
+
+        previous, self._compiled = self._compiled, {}
+        for ruleset in rulesets:
+            for pattern in ruleset.get("bio_and_message_keywords", {}).get("regex_patterns", []):
+                if pattern in previous:
+                    self._compiled[pattern] = previous[pattern]
+                else:
+                    self.get(pattern)
+        logger.info(f"Pattern registry rebuilt with {len(self._compiled)} regex pattern(s).")
+
+
+pattern_registry = PatternRegistry()
+
+
 def test_text_against_regex(text_to_check: str, regex_patterns: list[str], regex_source_label: str | None = None) -> list[str]:
     """
     Tests a given string against a list of regex patterns.
@@ -369,15 +428,14 @@ def test_text_against_regex(text_to_check: str, regex_patterns: list[str], regex
     triggered_patterns = []
 
     for index, pattern in enumerate(regex_patterns, start=1):
-        try:
-            if re.search(pattern, text_to_check):
-                if regex_source_label:
-                    triggered_patterns.append(f"{regex_source_label} regex #{index}: {pattern}")
-                else:
-                    triggered_patterns.append(f"Regex #{index}: {pattern}")
-        except re.error as e:
-            logger.warning(f"Invalid regex pattern encountered during test: '{pattern}' - {e}")
+        compiled = pattern_registry.get(pattern)
+        if compiled is None:
             continue
+        if compiled.search(text_to_check):
+            if regex_source_label:
+                triggered_patterns.append(f"{regex_source_label} regex #{index}: {pattern}")
+            else:
+                triggered_patterns.append(f"Regex #{index}: {pattern}")
             
     return triggered_patterns
 
@@ -395,7 +453,8 @@ def check_text_for_keywords(text_to_check: str, ruleset: dict, regex_source_labe
     if whitelisted_patterns:
         # We can combine them into a single, fast regex for the check
         whitelist_regex = r"(?i)\b(?:https?://)?(?:www\.)?(?:" + "|".join(whitelisted_patterns) + r")\b"
-        if re.search(whitelist_regex, text_to_check):
+        compiled_whitelist = _get_derived_pattern(whitelist_regex)
+        if compiled_whitelist is not None and compiled_whitelist.search(text_to_check):
             # A whitelisted domain was found. Return an empty list, indicating no flags.
             return []
 
@@ -403,7 +462,11 @@ def check_text_for_keywords(text_to_check: str, ruleset: dict, regex_source_labe
     # If we reach this point, no whitelisted domains were found.
     # Now we can proceed with the normal keyword and link-nuking checks.
     triggered = []
-    normalized_text = unidecode(text_to_check).lower()
+    # unidecode is a no-op on ASCII text, which is the common case
+    if text_to_check.isascii():
+        normalized_text = text_to_check.lower()
+    else:
+        normalized_text = unidecode(text_to_check).lower()
 
     # --- Substring/Simple Keywords (Aggressive Match) ---
     substring_keywords = ruleset.get("substring", []) + ruleset.get("simple_keywords", [])
@@ -414,8 +477,8 @@ def check_text_for_keywords(text_to_check: str, ruleset: dict, regex_source_labe
     # --- Smart/Whole Word Keywords (Precise Match) ---
     smart_keywords = ruleset.get("smart", [])
     for keyword in smart_keywords:
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        if re.search(pattern, normalized_text):
+        compiled = _get_derived_pattern(r'\b' + re.escape(keyword.lower()) + r'\b')
+        if compiled is not None and compiled.search(normalized_text):
             triggered.append(keyword)
 
     # --- Regex Pattern Check (Against ORIGINAL Text) ---
@@ -545,8 +608,8 @@ async def perform_automated_banned_elsewhere_ban(bot: 'AntiScamBot', alert_messa
     reason = truncate_audit_reason(f"[Automated Action] {ban_reason_detail} | AlertID:{alert_message.id}")
 
     try:
-        delete_days = get_delete_days_for_guild(bot, guild)
-        await guild.ban(member, reason=reason, delete_message_seconds=delete_days * 86400)
+        delete_seconds = get_delete_seconds_for_guild(bot, guild)
+        await guild.ban(member, reason=reason, delete_message_seconds=delete_seconds)
         logger.info(f"AUTOMATED BAN of {member.name} in {guild.name} (Reason: Banned Elsewhere).")
 
         embed = alert_message.embeds[0]
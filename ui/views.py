@@ -3,18 +3,57 @@
 import discord
 import re
 import asyncio
+import itertools
+import time
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 from config import logger
 import data_manager
 from utils.federation_handler import process_federated_ban, process_federated_unban
 from utils.command_helpers import update_onboard_command_visibility, edit_regex_by_id
-from utils.helpers import get_delete_days_for_guild, truncate_audit_reason
+from utils.helpers import get_delete_seconds_for_guild, truncate_audit_reason, ban_with_backoff, call_with_backoff
 from screening_handler import test_text_against_regex
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
 
+# Max concurrent ban requests while onboarding. Bans share a per-guild rate-limit bucket,
+# so a small cap overlaps request latency without just queueing on the limiter.
+ONBOARD_CONCURRENCY = 5
+
+# Discord's bulk ban endpoint accepts at most this many user IDs per request.
+BULK_BAN_MAX_USERS = 200
+
+# Minimum delay between onboarding progress embed edits.
+PROGRESS_EDIT_INTERVAL_SECONDS = 3.0
+
+# Max in-flight announcement sends; each channel is its own route bucket.
+ANNOUNCEMENT_CONCURRENCY = 32
+
+# (alert title substring, field name prefix, reason template) used to describe a ban from a
+# screening alert. Templates may use {suffix} (field name after the prefix) and {value}.
+_BAN_REASON_DISPATCH = (
+    ("User Banned Elsewhere", "Banned In: ", "User already banned in {suffix}."),
+    ("Flagged User", "🚩 Trigger", "Flagged by keyword screening. Trigger: {value}."),
+    ("Flagged Message", "🚩 Trigger", "Flagged for a message. Trigger: {value}."),
+)
+
+def _parse_footer_user_id(footer_text: str) -> Optional[int]:
+    """Extracts the user ID from an alert footer of the form 'User ID: <digits>'."""
+    _, sep, rest = footer_text.partition("User ID: ")
+    if not sep:
+        return None
+    head = rest.split(None, 1)
+    digits = head[0].rstrip(".,") if head else ""
+    return int(digits) if digits.isdigit() else None
+
+def _field_index(embed: discord.Embed) -> dict[str, int]:
+    """Maps each embed field name to the index of its first occurrence."""
+    index: dict[str, int] = {}
+    for i, field in enumerate(embed.fields):
+        index.setdefault(field.name, i)
+    return index
+
 # --- MODALS ---
 class RegexTestModal(discord.ui.Modal, title="Regex Test"):
     def __init__(self, pattern: str, compiled_regex: re.Pattern):
@@ -74,7 +113,8 @@ class TestCurrentRegexModal(discord.ui.Modal, title="Test Against Current Regex"
         # Gather all applicable regex patterns (local and global)
         local_patterns = keywords_data.get("per_server_keywords", {}).get(guild_id_str, {}).get("bio_and_message_keywords", {}).get("regex_patterns", [])
         global_patterns = keywords_data.get("global_keywords", {}).get("bio_and_message_keywords", {}).get("regex_patterns", [])
-        all_patterns = list(set(local_patterns + global_patterns))
+        # Order-preserving dedupe so pattern numbering is stable between runs
+        all_patterns = list(dict.fromkeys(itertools.chain(local_patterns, global_patterns)))
 
         if not all_patterns:
             await interaction.followup.send("There are no regex patterns configured for this server or globally.", ephemeral=True)
@@ -107,6 +147,16 @@ class TestCurrentRegexModal(discord.ui.Modal, title="Test Against Current Regex"
 
 # --- VIEWS ---
 class ScreeningView(discord.ui.View):
+    # Disabled flags for (ban, kick, ignore, unban) per user state:
+    # 'initial' - user is in the server (likely timed out), awaiting action
+    # 'banned'  - user has been banned; only unban remains available
+    # 'kicked'  - user has been kicked, a final action for this alert
+    _BUTTON_STATES = {
+        'initial': (False, False, False, True),
+        'banned': (True, True, True, False),
+        'kicked': (True, True, True, True),
+    }
+
     def __init__(self, flagged_member_id: Optional[int] = None):
         super().__init__(timeout=None)
         self.flagged_member_id = flagged_member_id
@@ -125,37 +175,29 @@ class ScreeningView(discord.ui.View):
         """Updates button disabled status based on the user's state.
         States: 'initial', 'banned', 'kicked'
         """
-        if state == 'initial':
-            # User is in the server (likely timed out), awaiting action
-            self.ban_button.disabled = False
-            self.kick_button.disabled = False
-            self.ignore_button.disabled = False
-            self.unban_button.disabled = True
-        elif state == 'banned':
-            # User has been banned from the server
-            self.ban_button.disabled = True
-            self.kick_button.disabled = True # Can't kick a banned user
-            self.ignore_button.disabled = True
-            self.unban_button.disabled = False
-        elif state == 'kicked':
-            # User has been kicked, a final action for this alert
-            self.ban_button.disabled = True
-            self.kick_button.disabled = True
-            self.ignore_button.disabled = True
-            self.unban_button.disabled = True
-
-    async def get_user_and_member(self, interaction: discord.Interaction) -> tuple[Optional[discord.User], Optional[discord.Member]]:
+        disabled_states = self._BUTTON_STATES.get(state)
+        if disabled_states is None:
+            return
+        (
+            self.ban_button.disabled,
+            self.kick_button.disabled,
+            self.ignore_button.disabled,
+            self.unban_button.disabled,
+        ) = disabled_states
+
+    async def _resolve_snowflake(self, interaction: discord.Interaction) -> tuple[Optional[discord.abc.Snowflake], Optional[discord.Member]]:
         """
-        Fetches the User object and, if possible, the Member object.
-        The User object is almost always available, while the Member is only if they are in the server.
+        Resolves the flagged user as a snowflake and, if possible, the Member object.
+        Ban/unban only need an ID, so this never calls fetch_user: a cached User is returned when
+        available and a bare discord.Object otherwise. The Member is only set if they are in the server.
         """
         bot: 'AntiScamBot' = interaction.client
         if not self.flagged_member_id:
             try:
                 embed_footer = interaction.message.embeds[0].footer.text
-                match = re.search(r'User ID: (\d+)', embed_footer)
-                if match:
-                    self.flagged_member_id = int(match.group(1))
+                footer_user_id = _parse_footer_user_id(embed_footer)
+                if footer_user_id:
+                    self.flagged_member_id = footer_user_id
                 else:
                     await interaction.followup.send("❌ Could not find user ID in the alert footer.", ephemeral=True)
                     return None, None
@@ -163,25 +205,19 @@ class ScreeningView(discord.ui.View):
                 await interaction.followup.send("❌ Could not parse user ID from the alert.", ephemeral=True)
                 return None, None
 
-        user = bot.get_user(self.flagged_member_id)
-        if not user:
-            try:
-                user = await bot.fetch_user(self.flagged_member_id)
-            except discord.NotFound:
-                await interaction.followup.send("❌ User ID is invalid or the user account was deleted.", ephemeral=True)
-                return None, None
-        
+        user = bot.get_user(self.flagged_member_id) or discord.Object(id=self.flagged_member_id)
         member = interaction.guild.get_member(self.flagged_member_id)
         
         return user, member
                 
-    async def update_embed(self, interaction: discord.Interaction, status: str, color: discord.Color):
+    async def update_embed(self, interaction: discord.Interaction, status: str, color: discord.Color, field_index: Optional[dict[str, int]] = None):
         embed = interaction.message.embeds[0]
         embed.color = color
-        for i, field in enumerate(embed.fields):
-            if field.name == "Status":
-                embed.set_field_at(i, name="Status", value=status, inline=True)
-                break
+        if field_index is None:
+            field_index = _field_index(embed)
+        status_index = field_index.get("Status")
+        if status_index is not None:
+            embed.set_field_at(status_index, name="Status", value=status, inline=True)
         await interaction.followup.edit_message(message_id=interaction.message.id, embed=embed, view=self)
 
     @discord.ui.button(label="Ban", style=discord.ButtonStyle.red, custom_id="screening_ban")
@@ -189,7 +225,7 @@ class ScreeningView(discord.ui.View):
         bot: 'AntiScamBot' = interaction.client
         await self.cancel_pending_ai_action(interaction)
         await interaction.response.defer()
-        result = await self.get_user_and_member(interaction)
+        result = await self._resolve_snowflake(interaction)
         if result == (None, None):
             return
         user, member = result
@@ -198,28 +234,25 @@ class ScreeningView(discord.ui.View):
             original_embed = interaction.message.embeds[0]
             descriptive_reason = "Reason not parsed from alert." # Fallback
 
-            if "User Banned Elsewhere" in original_embed.title:
-                for field in original_embed.fields:
-                    if "Banned In" in field.name:
-                        descriptive_reason = f"User already banned in {field.name.split(': ')[1]}."
-                        break
-            elif "Flagged User" in original_embed.title:
-                for field in original_embed.fields:
-                    if "Trigger" in field.name:
-                        descriptive_reason = f"Flagged by keyword screening. Trigger: {field.value.strip('`')}."
-                        break
-            elif "Flagged Message" in original_embed.title:
-                for field in original_embed.fields:
-                    if "Trigger" in field.name:
-                        descriptive_reason = f"Flagged for a message. Trigger: {field.value.strip('`')}."
-                        break
+            field_index = _field_index(original_embed)
+            alert_title = original_embed.title or ""
+
+            for title_key, field_prefix, reason_template in _BAN_REASON_DISPATCH:
+                if title_key not in alert_title:
+                    continue
+                field_name = next((name for name in field_index if name.startswith(field_prefix)), None)
+                if field_name:
+                    descriptive_reason = reason_template.format(
+                        suffix=field_name[len(field_prefix):],
+                        value=original_embed.fields[field_index[field_name]].value.strip('`'),
+                    )
+                break
             
             reason_text = truncate_audit_reason(
                 f"[Federated Action] {descriptive_reason} | AlertID:{interaction.message.id}"
             )
             
-            delete_days = get_delete_days_for_guild(bot, interaction.guild)
-            delete_seconds = delete_days * 86400
+            delete_seconds = get_delete_seconds_for_guild(bot, interaction.guild)
             
             await interaction.guild.ban(user, reason=reason_text, delete_message_seconds=delete_seconds)
             
@@ -229,7 +262,7 @@ class ScreeningView(discord.ui.View):
             if not member:
                 status_text += " (User had left)"
                 
-            await self.update_embed(interaction, status_text, discord.Color.red())
+            await self.update_embed(interaction, status_text, discord.Color.red(), field_index=field_index)
         except Exception as e:
             logger.error(f"Failed to ban user {self.flagged_member_id}: {e}", exc_info=True)
             await interaction.followup.send(f"❌ Error banning: {e}", ephemeral=True)
@@ -238,7 +271,7 @@ class ScreeningView(discord.ui.View):
     async def kick_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cancel_pending_ai_action(interaction)
         await interaction.response.defer()
-        result = await self.get_user_and_member(interaction)
+        result = await self._resolve_snowflake(interaction)
         if result == (None, None):
             return
         _, member = result
@@ -264,9 +297,9 @@ class ScreeningView(discord.ui.View):
         await interaction.response.defer()
 
         # <<< THE FIX: Call the helper function to get/recover the user ID first. >>>
-        result = await self.get_user_and_member(interaction)
+        result = await self._resolve_snowflake(interaction)
         if result == (None, None):
-            # get_user_and_member already sends an error message if it fails.
+            # _resolve_snowflake already sends an error message if it fails.
             return
         
         # Now we can safely use the user object from the result.
@@ -290,7 +323,7 @@ class ScreeningView(discord.ui.View):
     async def ignore_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cancel_pending_ai_action(interaction)
         await interaction.response.defer()
-        result = await self.get_user_and_member(interaction)
+        result = await self._resolve_snowflake(interaction)
         if result == (None, None):
             return
         _, member = result
@@ -320,9 +353,9 @@ class FederatedAlertView(discord.ui.View):
         if not self.banned_user_id:
             try:
                 embed_footer = interaction.message.embeds[0].footer.text
-                match = re.search(r'User ID: (\d+)', embed_footer)
-                if match:
-                    self.banned_user_id = int(match.group(1))
+                footer_user_id = _parse_footer_user_id(embed_footer)
+                if footer_user_id:
+                    self.banned_user_id = footer_user_id
                     logger.info(f"Recovered user ID {self.banned_user_id} from footer for persistent view.")
                 else:
                     await interaction.response.send_message("❌ Could not find a valid user ID in the alert footer.", ephemeral=True)
@@ -333,35 +366,33 @@ class FederatedAlertView(discord.ui.View):
             
         await interaction.response.defer()
         user_to_unban = discord.Object(id=self.banned_user_id)
+        embed = interaction.message.embeds[0]
         try:
             await interaction.guild.fetch_ban(user_to_unban)
         except discord.NotFound:
             button.disabled = True
             await interaction.followup.send("This user is not currently banned in this server.", ephemeral=True)
+            if "UPDATE:" not in (embed.description or ""):
+                embed.description = (embed.description or "") + f"\n\n**UPDATE:** Action attempted by {interaction.user.mention}, but user was already unbanned."
+        else:
             try:
-                embed = interaction.message.embeds[0]
-                if "UPDATE:" not in embed.description:
-                    embed.description += f"\n\n**UPDATE:** Action attempted by {interaction.user.mention}, but user was already unbanned."
-                await interaction.edit_original_response(embed=embed, view=self)
-            except Exception:
-                pass
-            return
-            
-        try:
-            reason_text = "[Local Action] Federated ban reversed by local Moderator."
-            await interaction.guild.unban(user_to_unban, reason=reason_text)
-            
-            embed = interaction.message.embeds[0]
+                reason_text = "[Local Action] Federated ban reversed by local Moderator."
+                await interaction.guild.unban(user_to_unban, reason=reason_text)
+            except Exception as e:
+                logger.error(f"Failed to reverse federated ban for {self.banned_user_id}: {e}", exc_info=True)
+                await interaction.followup.send(f"❌ An unexpected error occurred while unbanning: {e}", ephemeral=True)
+                return
+
             embed.color = discord.Color.green()
-            embed.description += f"\n\n**UPDATE:** User was unbanned from this server by {interaction.user.mention}."
+            embed.description = (embed.description or "") + f"\n\n**UPDATE:** User was unbanned from this server by {interaction.user.mention}."
             button.disabled = True
-            
-            await interaction.edit_original_response(embed=embed, view=self)
-            
             logger.info(f"Federated ban for {self.banned_user_id} was reversed in {interaction.guild.name} by {interaction.user.name}.")
+
+        # Single edit for both outcomes
+        try:
+            await interaction.edit_original_response(embed=embed, view=self)
         except Exception as e:
-            logger.error(f"Failed to reverse federated ban for {self.banned_user_id}: {e}", exc_info=True)
-            await interaction.followup.send(f"❌ An unexpected error occurred while unbanning: {e}", ephemeral=True)
+            logger.warning(f"Failed to update federated alert {interaction.message.id}: {e}")
 
 class FederatedUnbanAlertView(discord.ui.View):
     def __init__(self, unbanned_user_id: Optional[int] = None):
@@ -377,9 +408,9 @@ class FederatedUnbanAlertView(discord.ui.View):
             # Fallback to get ID from footer if needed
             try:
                 embed_footer = interaction.message.embeds[0].footer.text
-                match = re.search(r'User ID: (\d+)', embed_footer)
-                if match:
-                    self.unbanned_user_id = int(match.group(1))
+                footer_user_id = _parse_footer_user_id(embed_footer)
+                if footer_user_id:
+                    self.unbanned_user_id = footer_user_id
                 else:
                     await interaction.followup.send("❌ Could not find user ID in the alert footer.", ephemeral=True)
                     return
@@ -390,12 +421,12 @@ class FederatedUnbanAlertView(discord.ui.View):
         user_to_reban = discord.Object(id=self.unbanned_user_id)
         try:
             reason_text = "[Local Action] Federated unban reversed by local Moderator."
-            delete_days = get_delete_days_for_guild(bot, interaction.guild)
-            await interaction.guild.ban(user_to_reban, reason=reason_text, delete_message_seconds=delete_days * 86400)
+            delete_seconds = get_delete_seconds_for_guild(bot, interaction.guild)
+            await interaction.guild.ban(user_to_reban, reason=reason_text, delete_message_seconds=delete_seconds)
             
             embed = interaction.message.embeds[0]
             embed.color = discord.Color.orange()
-            embed.description += f"\n\n**UPDATE:** User was re-banned in this server by {interaction.user.mention}."
+            embed.description = (embed.description or "") + f"\n\n**UPDATE:** User was re-banned in this server by {interaction.user.mention}."
             button.disabled = True
             await interaction.message.edit(embed=embed, view=self)
             logger.info(f"Federated unban for {self.unbanned_user_id} was reversed in {interaction.guild.name} by {interaction.user.name}.")
@@ -410,6 +441,9 @@ class ConfirmGlobalBanView(discord.ui.View):
         self.author = author
         self.user_to_ban = user_to_ban
         self.reason = reason
+        # Build the confirmation embed author up front to keep it off the button's response path.
+        self._author_name = f"{user_to_ban.name} (`{user_to_ban.id}`)"
+        self._author_icon = user_to_ban.display_avatar.url
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.author.id:
@@ -433,9 +467,9 @@ class ConfirmGlobalBanView(discord.ui.View):
                         title="✅ Proactive Global Ban Initiated",
                         description="Ban was initiated from this server and has been broadcast to all federated servers.",
                         color=discord.Color.blue(),
-                        timestamp=datetime.now(timezone.utc)
+                        timestamp=discord.utils.utcnow()
                     )
-                    confirm_embed.set_author(name=f"{self.user_to_ban.name} (`{self.user_to_ban.id}`)", icon_url=self.user_to_ban.display_avatar.url)
+                    confirm_embed.set_author(name=self._author_name, icon_url=self._author_icon)
                     confirm_embed.add_field(name="Reason", value=f"```{self.reason}```", inline=False)
                     await origin_mod_channel.send(embed=confirm_embed)
             detailed_reason_field = {"name": "Ban Reason", "value": f"```{self.reason}```"}
@@ -491,7 +525,7 @@ class AlreadyBannedView(discord.ui.View):
             # User is not banned locally, so proceed with the ban
             try:
                 local_reason = f"[Local Action] Banned by {interaction.user.name} via global-ban command. Original reason: {self.reason}"
-                delete_seconds = get_delete_days_for_guild(self.bot, interaction.guild) * 86400
+                delete_seconds = get_delete_seconds_for_guild(self.bot, interaction.guild)
                 await interaction.guild.ban(self.user_to_ban, reason=local_reason[:512], delete_message_seconds=delete_seconds)
                 await interaction.followup.send(f"✅ **Success!** {self.user_to_ban.name} has been banned from this server.", ephemeral=True)
                 logger.info(f"Moderator {interaction.user.name} applied a local-only ban to {self.user_to_ban.name} in {interaction.guild.name}.")
@@ -515,6 +549,10 @@ class ConfirmGlobalUnbanView(discord.ui.View):
         self.author = author
         self.user_to_unban = user_to_unban
         self.reason = reason
+        # Build the confirmation embed author up front to keep it off the button's response path.
+        self._author_name = f"{user_to_unban.name} (`{user_to_unban.id}`)"
+        avatar = getattr(user_to_unban, 'display_avatar', None)
+        self._author_icon = avatar.url if avatar else None
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.author.id:
@@ -536,12 +574,9 @@ class ConfirmGlobalUnbanView(discord.ui.View):
                     title="✅ Proactive Global Unban Initiated",
                     description="Unban was initiated from this server and has been broadcast to all federated servers.",
                     color=discord.Color.green(),
-                    timestamp=datetime.now(timezone.utc)
+                    timestamp=discord.utils.utcnow()
                 )
-                if hasattr(self.user_to_unban, 'display_avatar') and self.user_to_unban.display_avatar:
-                    confirm_embed.set_author(name=f"{self.user_to_unban.name} (`{self.user_to_unban.id}`)", icon_url=self.user_to_unban.display_avatar.url)
-                else:
-                    confirm_embed.set_author(name=f"{self.user_to_unban.name} (`{self.user_to_unban.id}`)")
+                confirm_embed.set_author(name=self._author_name, icon_url=self._author_icon)
                 confirm_embed.add_field(name="Reason", value=f"```{self.reason}```", inline=False)
                 await origin_mod_channel.send(embed=confirm_embed)
 
@@ -619,7 +654,7 @@ class ConfirmRegexEditView(discord.ui.View):
         await interaction.response.edit_message(content="Regex edit cancelled.", view=self)
 
 class OnboardView(discord.ui.View):
-    def __init__(self, bot: 'AntiScamBot', author: discord.User, fed_bans: dict):
+    def __init__(self, bot: 'AntiScamBot', author: discord.User, fed_bans: data_manager.FedBanColumns):
         super().__init__(timeout=300.0)
         self.bot = bot
         self.author = author
@@ -631,6 +666,47 @@ class OnboardView(discord.ui.View):
             return False
         return True
 
+    async def _apply_one(self, target_guild: discord.Guild, user_id: int, audit_reason: str, delete_seconds: int, semaphore: asyncio.Semaphore) -> str:
+        """Applies a single historical ban. Returns 'applied' or 'failed'."""
+        user_obj = discord.Object(id=user_id)
+
+        async with semaphore:
+            try:
+                await ban_with_backoff(target_guild, user_obj, audit_reason, delete_seconds)
+                return "applied"
+            except Exception as e:
+                logger.warning(f"Failed to onboard-ban user {user_id} in {target_guild.name}: {e}")
+                return "failed"
+
+    async def _apply_batch(self, target_guild: discord.Guild, user_ids: list[int], audit_reason: str, delete_seconds: int, semaphore: asyncio.Semaphore) -> tuple[int, int]:
+        """
+        Applies historical bans that share one audit reason with a single bulk ban request.
+        Falls back to one request per user if the bulk call is rejected or unavailable
+        (Guild.bulk_ban needs discord.py 2.4+). Returns (applied, failed).
+        """
+        result = None
+        if len(user_ids) > 1 and hasattr(target_guild, "bulk_ban"):
+            users = [discord.Object(id=user_id) for user_id in user_ids]
+            async with semaphore:
+                try:
+                    result = await call_with_backoff(
+                        lambda: target_guild.bulk_ban(users, reason=audit_reason, delete_message_seconds=delete_seconds)
+                    )
+                except discord.HTTPException as e:
+                    # e.g. the bot lacks Manage Server, which the bulk endpoint additionally requires.
+                    logger.warning(f"Bulk ban of {len(user_ids)} users failed in {target_guild.name}, falling back to single bans: {e}")
+
+        if result is None:
+            outcomes = await asyncio.gather(
+                *(self._apply_one(target_guild, user_id, audit_reason, delete_seconds, semaphore) for user_id in user_ids)
+            )
+            applied = outcomes.count("applied")
+            return applied, len(outcomes) - applied
+
+        for failed_user in result.failed:
+            logger.warning(f"Failed to onboard-ban user {failed_user.id} in {target_guild.name} (bulk ban).")
+        return len(result.banned), len(result.failed)
+
     @discord.ui.button(label="Begin Onboarding", style=discord.ButtonStyle.danger)
     async def begin_onboarding(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer()
@@ -651,36 +727,69 @@ class OnboardView(discord.ui.View):
         progress_message = await interaction.followup.send(embed=progress_embed, wait=True)
 
         target_guild = interaction.guild
-        total_bans = len(self.fed_bans)
+        total_bans = len(self.fed_bans.user_ids)
         applied_count = 0
         already_banned_count = 0
         failed_count = 0
-        update_interval = 25
-
-        for i, (user_id_str, ban_data) in enumerate(self.fed_bans.items()):
-            user_id = int(user_id_str)
-            user_obj = discord.Object(id=user_id)
+        last_progress_edit = time.monotonic()
+        progress_edit_task: Optional[asyncio.Task] = None
 
-            try:
-                await target_guild.fetch_ban(user_obj)
-                already_banned_count += 1
+        # One paginated read of the guild's ban list replaces a fetch_ban probe per user.
+        # Discord accepts a ban on an already-banned user silently, so ban() alone can't tell us.
+        try:
+            existing_ban_ids = {entry.user.id async for entry in target_guild.bans(limit=None)}
+        except Exception as e:
+            logger.warning(f"Could not read existing bans in {target_guild.name} before onboarding: {e}")
+            existing_ban_ids = set()
+
+        # Many bans share an original reason, so each audit-log reason is built and truncated once,
+        # and the users behind it can be banned together.
+        audit_reasons: dict[str, str] = {}
+        pending_by_reason: dict[str, list[int]] = {}
+        pending_count = 0
+        for user_id, reason in zip(self.fed_bans.user_ids, self.fed_bans.reasons):
+            if user_id in existing_ban_ids:
                 continue
-            except discord.NotFound:
-                try:
-                    reason = f"Federated ban sync. Original reason: {ban_data.get('reason', 'N/A')}"
-                    delete_days = get_delete_days_for_guild(self.bot, target_guild)
-                    delete_seconds = delete_days * 86400
-                    await target_guild.ban(user_obj, reason=reason[:512], delete_message_seconds=delete_seconds)
-                    applied_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to onboard-ban user {user_id} in {target_guild.name}: {e}")
-                    failed_count += 1
-            
-            if (i + 1) % update_interval == 0 or (i + 1) == total_bans:
-                progress_embed.set_field_at(0, name="Checked", value=f"`{i+1} / {total_bans}`", inline=True)
-                progress_embed.set_field_at(1, name="Applied", value=f"`{applied_count}`", inline=True)
-                progress_embed.set_field_at(2, name="Failed", value=f"`{failed_count}`", inline=True)
-                await progress_message.edit(embed=progress_embed)
+            audit_reason = audit_reasons.get(reason)
+            if audit_reason is None:
+                audit_reason = audit_reasons[reason] = f"Federated ban sync. Original reason: {reason}"[:512]
+            pending_by_reason.setdefault(audit_reason, []).append(user_id)
+            pending_count += 1
+        already_banned_count = total_bans - pending_count
+
+        # Depends only on the guild's config, so resolve it once for the whole run.
+        delete_seconds = get_delete_seconds_for_guild(self.bot, target_guild)
+        semaphore = asyncio.Semaphore(ONBOARD_CONCURRENCY)
+        # Batches are produced lazily and pulled by a fixed pool of workers, so a 60k+ ban list
+        # never has more than ONBOARD_CONCURRENCY batches in flight (most reasons are unique).
+        batches = (
+            (audit_reason, user_ids[start:start + BULK_BAN_MAX_USERS])
+            for audit_reason, user_ids in pending_by_reason.items()
+            for start in range(0, len(user_ids), BULK_BAN_MAX_USERS)
+        )
+
+        async def apply_batches():
+            nonlocal applied_count, failed_count, last_progress_edit, progress_edit_task
+            for audit_reason, batch_user_ids in batches:
+                applied, failed = await self._apply_batch(target_guild, batch_user_ids, audit_reason, delete_seconds, semaphore)
+                applied_count += applied
+                failed_count += failed
+
+                # Time-debounced, non-blocking progress edits; skip if the previous edit is still in flight.
+                now = time.monotonic()
+                if now - last_progress_edit >= PROGRESS_EDIT_INTERVAL_SECONDS and (progress_edit_task is None or progress_edit_task.done()):
+                    checked_count = already_banned_count + applied_count + failed_count
+                    progress_embed.set_field_at(0, name="Checked", value=f"`{checked_count} / {total_bans}`", inline=True)
+                    progress_embed.set_field_at(1, name="Applied", value=f"`{applied_count}`", inline=True)
+                    progress_embed.set_field_at(2, name="Failed", value=f"`{failed_count}`", inline=True)
+                    progress_edit_task = asyncio.create_task(progress_message.edit(embed=progress_embed))
+                    last_progress_edit = now
+
+        await asyncio.gather(*(apply_batches() for _ in range(ONBOARD_CONCURRENCY)))
+
+        # Make sure a late progress edit can't overwrite the completion embed.
+        if progress_edit_task is not None:
+            await asyncio.gather(progress_edit_task, return_exceptions=True)
 
         completion_embed = discord.Embed(
             title="✅ Onboarding Complete",
@@ -709,67 +818,119 @@ class OnboardView(discord.ui.View):
         await interaction.response.edit_message(content="Onboarding cancelled.", view=self, embed=None)
 
 class LookupPaginatorView(discord.ui.View):
-    def __init__(self, author: discord.User, query: str, results: list):
-        super().__init__(timeout=300.0)
+    TITLE_PREFIX = "Ban List Search Results for "
+
+    def __init__(self, author: Optional[discord.abc.User] = None, query: str = "", results: Optional[list] = None):
+        # Without results this is the persistent instance registered at startup. It only handles
+        # clicks on paginators whose live view has timed out or was lost in a restart, by
+        # rebuilding the state from the message itself.
+        super().__init__(timeout=300.0 if results is not None else None)
         self.author = author
         self.query = query
         self.results = results
         
         self.current_page = 0
         self.items_per_page = 5
-        self.total_pages = (len(self.results) - 1) // self.items_per_page + 1
+        self.total_pages = (len(results or []) - 1) // self.items_per_page + 1
 
-        mentioned_users = [discord.Object(id=int(user_id)) for user_id, data in self.results]
+        mentioned_users = [discord.Object(id=int(user_id)) for user_id, data in results or []]
         self.allowed = discord.AllowedMentions(users=mentioned_users)
 
+        # Results never change for this view, so format each entry once instead of per page flip.
+        self._formatted_results = [self._format_result(user_id, data) for user_id, data in results or []]
+        self._page_cache: dict[int, discord.Embed] = {}
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.author is None:
+            # Persistent instance: ownership is checked once the session is restored.
+            return True
         if interaction.user.id != self.author.id:
             await interaction.response.send_message("You are not the one who initiated this command.", ephemeral=True)
             return False
         return True
 
+    @classmethod
+    async def restore(cls, interaction: discord.Interaction) -> Optional['LookupPaginatorView']:
+        """Rebuilds a paginator from the query in the embed title and the page in the footer."""
+        try:
+            embed = interaction.message.embeds[0]
+            title = embed.title or ""
+            if not title.startswith(cls.TITLE_PREFIX):
+                return None
+            query = title[len(cls.TITLE_PREFIX):].strip('"')
+            page_text = (embed.footer.text or "").removeprefix("Page ").split(" of ", 1)[0]
+            current_page = int(page_text) - 1 if page_text.isdigit() else 0
+        except (IndexError, AttributeError):
+            return None
+
+        results = await data_manager.db_search_bans(query)
+        if not results:
+            return None
+
+        metadata = getattr(interaction.message, "interaction_metadata", None)
+        author = getattr(metadata, "user", None) or interaction.user
+        view = cls(author=author, query=query, results=results)
+        view.current_page = max(0, min(current_page, view.total_pages - 1))
+        return view
+
+    async def _turn_page(self, interaction: discord.Interaction, step: int):
+        view = self
+        if self.results is None:
+            view = await self.restore(interaction)
+            if view is None:
+                await interaction.response.send_message("❌ This search has expired. Please run `/lookup` again.", ephemeral=True)
+                return
+            if interaction.user.id != view.author.id:
+                await interaction.response.send_message("You are not the one who initiated this command.", ephemeral=True)
+                return
+
+        new_page = view.current_page + step
+        if 0 <= new_page < view.total_pages:
+            view.current_page = new_page
+            await interaction.response.edit_message(embed=view.create_embed(), view=view, allowed_mentions=view.allowed)
+
+    @staticmethod
+    def _format_result(user_id: str, data: dict) -> str:
+        username = data.get("username_at_ban") or data.get("username") or "N/A"
+        return (
+            f"**Username:** {username}\n"
+            f"**User ID:** `{user_id}`\n"
+            f"**Origin:** {data.get('origin_guild_name', 'N/A')}\n"
+            f"**Reason:** {data.get('reason', 'N/A')}"
+        )
+
     def create_embed(self) -> discord.Embed:
-        """Creates the embed for the current page."""
+        """Creates the embed for the current page, reusing it if the page was already rendered."""
+        self.prev_button.disabled = self.current_page == 0
+        self.next_button.disabled = self.current_page >= self.total_pages - 1
+
+        cached_embed = self._page_cache.get(self.current_page)
+        if cached_embed is not None:
+            return cached_embed
+
         start_index = self.current_page * self.items_per_page
         end_index = start_index + self.items_per_page
-        page_results = self.results[start_index:end_index]
+        page_content = self._formatted_results[start_index:end_index]
 
         embed = discord.Embed(
-            title=f"Ban List Search Results for \"{self.query}\"",
+            title=f"{self.TITLE_PREFIX}\"{self.query}\"",
             description=f"Found **{len(self.results)}** matching record(s).",
             color=discord.Color.blue()
         )
-
-        page_content = []
-        for user_id, data in page_results:
-            username = data.get("username_at_ban") or data.get("username") or "N/A"
-            entry = (
-                f"**Username:** {username}\n"
-                f"**User ID:** `{user_id}`\n"
-                f"**Origin:** {data.get('origin_guild_name', 'N/A')}\n"
-                f"**Reason:** {data.get('reason', 'N/A')}"
-            )
-            page_content.append(entry)
         
         embed.description += "\n\n" + "\n--------------------\n".join(page_content)
         embed.set_footer(text=f"Page {self.current_page + 1} of {self.total_pages}")
         
-        self.prev_button.disabled = self.current_page == 0
-        self.next_button.disabled = self.current_page >= self.total_pages - 1
-        
+        self._page_cache[self.current_page] = embed
         return embed
 
     @discord.ui.button(label="◄ Previous", style=discord.ButtonStyle.secondary, custom_id="lookup_prev")
     async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page > 0:
-            self.current_page -= 1
-            await interaction.response.edit_message(embed=self.create_embed(), view=self, allowed_mentions=self.allowed)
+        await self._turn_page(interaction, -1)
 
     @discord.ui.button(label="Next ►", style=discord.ButtonStyle.secondary, custom_id="lookup_next")
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            await interaction.response.edit_message(embed=self.create_embed(), view=self, allowed_mentions=self.allowed)
+        await self._turn_page(interaction, 1)
 
 class AnnouncementModal(discord.ui.Modal, title="New System Announcement"):
     def __init__(self, bot: 'AntiScamBot'):
@@ -784,6 +945,38 @@ class AnnouncementModal(discord.ui.Modal, title="New System Announcement"):
         max_length=1500
     )
 
+    async def _broadcast_to_guild(self, guild_id: int, announcement_embed: discord.Embed, semaphore: asyncio.Semaphore) -> tuple[bool, str]:
+        """Sends the announcement to a guild's configured channels. Returns (success, report label)."""
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return False, f"`{guild_id}` (Not Found)"
+
+        # Deduplicated at config load, so a shared alert/notice channel only gets one copy
+        channel_ids = self.bot.config.get("announcement_channels_per_guild", {}).get(guild_id, frozenset())
+
+        if not channel_ids:
+            return False, f"{guild.name} (No channels configured)"
+
+        sent_successfully = False
+        for channel_id in channel_ids:
+            channel = guild.get_channel(channel_id)
+            if not channel:
+                logger.warning(f"Announcement: Could not find channel {channel_id} in {guild.name}.")
+                continue
+            
+            try:
+                async with semaphore:
+                    await call_with_backoff(lambda: channel.send(embed=announcement_embed))
+                sent_successfully = True
+            except discord.Forbidden:
+                logger.error(f"Announcement: Missing permissions to send to #{channel.name} in {guild.name}.")
+            except Exception as e:
+                logger.error(f"Announcement: Failed to send to #{channel.name} in {guild.name}: {e}")
+        
+        if sent_successfully:
+            return True, guild.name
+        return False, f"{guild.name} (All sends failed)"
+
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
@@ -796,49 +989,26 @@ class AnnouncementModal(discord.ui.Modal, title="New System Announcement"):
         )
         announcement_embed.set_footer(text=f"A message from the {self.bot.user.name} maintainer.")
 
-        # 2. Iterate and send
-        success_guilds = []
-        failed_guilds = []
-        
+        # 2. Send to every federated guild concurrently
         federated_guild_ids = self.bot.config.get("federated_guild_ids", [])
-        for guild_id in federated_guild_ids:
-            guild = self.bot.get_guild(guild_id)
-            if not guild:
-                failed_guilds.append(f"`{guild_id}` (Not Found)")
-                continue
+        semaphore = asyncio.Semaphore(ANNOUNCEMENT_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._broadcast_to_guild(guild_id, announcement_embed, semaphore) for guild_id in federated_guild_ids),
+            return_exceptions=True
+        )
 
-            # Get a unique set of channel IDs to avoid double-sending
-            channel_ids = set()
-            alert_channel_id = self.bot.config.get("action_alert_channels", {}).get(str(guild.id))
-            notice_channel_id = self.bot.config.get("federation_notice_channels", {}).get(str(guild.id))
-            if alert_channel_id:
-                channel_ids.add(alert_channel_id)
-            if notice_channel_id:
-                channel_ids.add(notice_channel_id)
-
-            if not channel_ids:
-                failed_guilds.append(f"{guild.name} (No channels configured)")
+        success_guilds = []
+        failed_guilds = []
+        for guild_id, result in zip(federated_guild_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Announcement: Unexpected error broadcasting to guild {guild_id}: {result}")
+                failed_guilds.append(f"`{guild_id}` (Error)")
                 continue
-
-            sent_successfully = False
-            for channel_id in channel_ids:
-                channel = guild.get_channel(channel_id)
-                if not channel:
-                    logger.warning(f"Announcement: Could not find channel {channel_id} in {guild.name}.")
-                    continue
-                
-                try:
-                    await channel.send(embed=announcement_embed)
-                    sent_successfully = True
-                except discord.Forbidden:
-                    logger.error(f"Announcement: Missing permissions to send to #{channel.name} in {guild.name}.")
-                except Exception as e:
-                    logger.error(f"Announcement: Failed to send to #{channel.name} in {guild.name}: {e}")
-            
+            sent_successfully, label = result
             if sent_successfully:
-                success_guilds.append(guild.name)
+                success_guilds.append(label)
             else:
-                failed_guilds.append(f"{guild.name} (All sends failed)")
+                failed_guilds.append(label)
 
         # 3. Send the final report back to the owner
         report_embed = discord.Embed(
@@ -868,9 +1038,6 @@ class ConfirmMassBanView(discord.ui.View):
 
     @discord.ui.button(label="Confirm Mass Ban", style=discord.ButtonStyle.danger)
     async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Local imports
-        from utils.federation_handler import process_federated_ban
-        
         for item in self.children:
             item.disabled = True
         await interaction.response.edit_message(content=f"⏳ **Processing {len(self.target_ids)} bans...**", view=self, embed=None)
@@ -882,6 +1049,7 @@ class ConfirmMassBanView(discord.ui.View):
         failed_ids = []
 
         detailed_reason_field = {"name": "Mass Ban Reason", "value": f"```{self.reason}```"}
+        delete_seconds = get_delete_seconds_for_guild(self.bot, interaction.guild)
 
         for uid in self.target_ids:
             try:
@@ -907,12 +1075,11 @@ class ConfirmMassBanView(discord.ui.View):
                         # Result: On List, but NOT Banned Locally.
                         # Action: Apply Local Ban (Catch-up) with Rate Limit Retry.
                                                 
+                        local_reason = f"[Local Action] Mass Ban Catch-up. Federated reason: {existing_ban.get('reason', 'N/A')}"[:512]
                         # --- START RETRY LOOP ---
                         for attempt in range(3):
                             try:
-                                local_reason = f"[Local Action] Mass Ban Catch-up. Federated reason: {existing_ban.get('reason', 'N/A')}"
-                                delete_seconds = get_delete_days_for_guild(self.bot, interaction.guild) * 86400
-                                await interaction.guild.ban(user_to_ban, reason=local_reason[:512], delete_message_seconds=delete_seconds)
+                                await interaction.guild.ban(user_to_ban, reason=local_reason, delete_message_seconds=delete_seconds)
                                 
                                 local_catchup_count += 1
                                 break # Success! Exit retry loop.
@@ -10,11 +10,17 @@ if TYPE_CHECKING:
     from antiscam import AntiScamBot
 
 # --- PERMISSION CHECKS ---
+async def get_app_owner_id(bot: 'AntiScamBot') -> int:
+    """Returns the application owner's ID, fetching application_info() only on first use."""
+    if bot.app_owner_id is None:
+        app_info = await bot.application_info()
+        bot.app_owner_id = app_info.owner.id
+    return bot.app_owner_id
+
 def is_bot_owner():
     """A check decorator to ensure the user is the bot's owner."""
     async def predicate(interaction: discord.Interaction) -> bool:
-        app_info = await interaction.client.application_info()
-        if interaction.user.id == app_info.owner.id:
+        if interaction.user.id == await get_app_owner_id(interaction.client):
             return True
         await interaction.response.send_message("❌ This command can only be used by the bot owner.", ephemeral=True)
         return False
@@ -29,24 +35,22 @@ def has_mod_role():
         bot: 'AntiScamBot' = interaction.client
         config = bot.config
         
-        app_info = await bot.application_info()
-        if interaction.user.id == app_info.owner.id:
+        if interaction.user.id == await get_app_owner_id(bot):
             return True
 
         if not interaction.guild:
             return False
 
-        if interaction.guild.id not in config.get("federated_guild_ids", []):
+        if interaction.guild.id not in config.get("federated_guild_id_set", frozenset()):
             await interaction.response.send_message("❌ This command can only be used in a federated server.", ephemeral=True)
             return False
 
-        whitelisted_mod_roles = config.get("moderator_roles_per_guild", {}).get(str(interaction.guild.id), [])
-        if not whitelisted_mod_roles:
+        mod_role_ids = config.get("moderator_role_sets_per_guild", {}).get(str(interaction.guild.id), frozenset())
+        if not mod_role_ids:
             await interaction.response.send_message("❌ Moderator roles are not configured for this server.", ephemeral=True)
             return False
 
-        user_role_ids = {role.id for role in interaction.user.roles}
-        if any(role_id in whitelisted_mod_roles for role_id in user_role_ids):
+        if any(role.id in mod_role_ids for role in interaction.user.roles):
             return True
         
         await interaction.response.send_message("❌ You do not have the required role to use this command.", ephemeral=True)
@@ -59,14 +63,12 @@ async def has_federated_mod_role(interaction: discord.Interaction) -> bool:
     bot: 'AntiScamBot' = interaction.client
     config = bot.config
     
-    federated_guild_ids = config.get("federated_guild_ids", [])
-    if interaction.guild.id not in federated_guild_ids:
+    if interaction.guild.id not in config.get("federated_guild_id_set", frozenset()):
         await interaction.response.send_message("❌ This command can only be used in a federated server.", ephemeral=True)
         return False
         
-    whitelisted_mod_roles = config.get("moderator_roles_per_guild", {}).get(str(interaction.guild.id), [])
-    user_role_ids = {role.id for role in interaction.user.roles}
-    if not any(role_id in whitelisted_mod_roles for role_id in user_role_ids):
+    mod_role_ids = config.get("moderator_role_sets_per_guild", {}).get(str(interaction.guild.id), frozenset())
+    if not any(role.id in mod_role_ids for role in interaction.user.roles):
         await interaction.response.send_message("❌ You do not have the required role to use this command.", ephemeral=True)
         return False
     return True
@@ -75,11 +77,7 @@ async def is_federated_moderator(bot: 'AntiScamBot', user_id_to_check: int) -> b
     """Checks if a user ID belongs to a moderator in ANY federated server concurrently."""
     config = bot.config
     
-    all_mod_roles = {
-        role_id
-        for role_list in config.get("moderator_roles_per_guild", {}).values()
-        for role_id in role_list
-    }
+    all_mod_roles = config.get("all_moderator_role_ids", frozenset())
 
     if not all_mod_roles:
         return False
@@ -89,6 +87,14 @@ async def is_federated_moderator(bot: 'AntiScamBot', user_id_to_check: int) -> b
         if not guild:
             return False
         
+        # With the members intent the cache is authoritative once a guild is chunked,
+        # so only fall back to an HTTP fetch for guilds that are not fully cached.
+        member = guild.get_member(user_id_to_check)
+        if member is not None:
+            return any(role.id in all_mod_roles for role in member.roles)
+        if guild.chunked:
+            return False
+
         try:
             member = await guild.fetch_member(user_id_to_check)
             if not member:
@@ -100,15 +106,18 @@ async def is_federated_moderator(bot: 'AntiScamBot', user_id_to_check: int) -> b
             logger.warning(f"Could not fetch member {user_id_to_check} in guild {guild.name} for is_federated_moderator check: {e}")
             return False
 
-    tasks = [check_guild(guild_id) for guild_id in config.get("federated_guild_ids", [])]
-    
-    for future in asyncio.as_completed(tasks):
-        result = await future
-        if result:
-            logger.info(f"is_federated_moderator check PASSED for {user_id_to_check}.")
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-            return True
-    
-    return False
+    pending = {asyncio.create_task(check_guild(guild_id)) for guild_id in config.get("federated_guild_ids", [])}
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(task.result() for task in done):
+                logger.info(f"is_federated_moderator check PASSED for {user_id_to_check}.")
+                return True
+        return False
+    finally:
+        # Cancel the remaining lookups and wait for them so no member fetch outlives the check.
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
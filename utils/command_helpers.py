@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import data_manager
 from config import logger
+from screening_handler import pattern_registry
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
@@ -36,7 +37,7 @@ async def add_global_keyword_to_list(interaction: discord.Interaction, keyword:
         return
 
     target_list.append(keyword)
-    await data_manager.save_keywords(keywords_data)
+    data_manager.mark_keywords_dirty(keywords_data)
 
     logger.info(f"OWNER {interaction.user.name} added global keyword '{keyword}'.")
     await interaction.followup.send(f"✅ Keyword '{keyword}' has been successfully added to the GLOBAL list.")
@@ -58,7 +59,7 @@ async def remove_global_keyword_from_list(interaction: discord.Interaction, keyw
 
     if keyword in target_list:
         target_list.remove(keyword)
-        await data_manager.save_keywords(keywords_data)
+        data_manager.mark_keywords_dirty(keywords_data)
         logger.info(f"OWNER {interaction.user.name} removed global keyword '{keyword}'.")
         await interaction.followup.send(f"✅ Keyword '{keyword}' has been removed from the GLOBAL list.")
     else:
@@ -121,14 +122,14 @@ async def add_keyword_to_list(interaction: discord.Interaction, keyword: str, pr
         return
 
     target_list.append(keyword)
-    await data_manager.save_keywords(keywords_data)
+    data_manager.mark_keywords_dirty(keywords_data)
 
     logger.info(f"Moderator {interaction.user.name} in {interaction.guild.name} added keyword '{keyword}'.")
     await interaction.followup.send(f"✅ Keyword '{keyword}' has been added to this server's local list.")
 
 async def add_regex_to_list(interaction: discord.Interaction, pattern: str, is_global: bool):
     try:
-        re.compile(pattern)
+        compiled = re.compile(pattern)
     except re.error as e:
         logger.warning(f"Moderator {interaction.user.name} tried to add an invalid regex: {pattern}. Error: {e}")
         await interaction.followup.send(f"❌ **Invalid Regex:** That pattern is not valid.\n`{e}`\nPlease test your pattern with `/test-regex` first.")
@@ -156,7 +157,8 @@ async def add_regex_to_list(interaction: discord.Interaction, pattern: str, is_g
         return
 
     target_list.append(pattern)
-    await data_manager.save_keywords(keywords_data)
+    pattern_registry.remember(pattern, compiled)
+    data_manager.mark_keywords_dirty(keywords_data)
     logger.info(f"User {interaction.user.name} added {list_name} regex: '{pattern}'")
     await interaction.followup.send(f"✅ Regex pattern has been successfully added to the **{list_name}** list.")
 
@@ -179,7 +181,7 @@ async def remove_keyword_from_list(interaction: discord.Interaction, keyword: st
 
     if keyword in target_list:
         target_list.remove(keyword)
-        await data_manager.save_keywords(keywords_data)
+        data_manager.mark_keywords_dirty(keywords_data)
         logger.info(f"Moderator {interaction.user.name} in {interaction.guild.name} removed keyword '{keyword}'.")
         await interaction.followup.send(f"✅ Keyword '{keyword}' has been removed from this server's local list.")
     else:
@@ -206,7 +208,8 @@ async def remove_regex_from_list_by_id(interaction: discord.Interaction, index:
 
     if target_list and 0 <= real_index < len(target_list):
         removed_pattern = target_list.pop(real_index)
-        await data_manager.save_keywords(keywords_data)
+        pattern_registry.discard(removed_pattern)
+        data_manager.mark_keywords_dirty(keywords_data)
         logger.info(f"User {interaction.user.name} removed {list_name} regex by ID #{index}: '{removed_pattern}'")
         await interaction.followup.send(f"✅ Regex pattern **`{index}`** has been removed from the **{list_name}** list.\n> `{removed_pattern}`")
     else:
@@ -218,7 +221,7 @@ async def edit_regex_by_id(interaction: discord.Interaction, index: int, new_pat
         return
 
     try:
-        re.compile(new_pattern)
+        compiled = re.compile(new_pattern)
     except re.error as e:
         logger.warning(f"Moderator {interaction.user.name} tried to edit to an invalid regex: {new_pattern}. Error: {e}")
         await interaction.followup.send(f"❌ **Invalid Regex:** That pattern is not valid.\n`{e}`\nPlease test your pattern with `/test-regex` first.")
@@ -252,7 +255,9 @@ async def edit_regex_by_id(interaction: discord.Interaction, index: int, new_pat
         return
 
     target_list[real_index] = new_pattern
-    await data_manager.save_keywords(keywords_data)
+    pattern_registry.discard(old_pattern)
+    pattern_registry.remember(new_pattern, compiled)
+    data_manager.mark_keywords_dirty(keywords_data)
     logger.info(
         f"User {interaction.user.name} edited {list_name} regex by ID #{index}: "
         f"'{old_pattern}' -> '{new_pattern}'"
@@ -263,6 +268,15 @@ async def edit_regex_by_id(interaction: discord.Interaction, index: int, new_pat
         f"> **New:** `{new_pattern}`"
     )
 
+async def _apply_onboard_permissions(bot: 'AntiScamBot', guild: discord.Guild, command, permissions: dict) -> bool:
+    """Pushes command permissions unless the same set was already applied. Returns True if an edit was sent."""
+    applied = frozenset((obj.id, allowed) for obj, allowed in permissions.items())
+    if bot.onboard_permissions_applied.get(guild.id) == applied:
+        return False
+    await bot.tree.edit_command_permissions(guild=guild, command=command, permissions=permissions)
+    bot.onboard_permissions_applied[guild.id] = applied
+    return True
+
 async def update_onboard_command_visibility(bot: 'AntiScamBot', guild: discord.Guild):
     try:
         onboard_command = bot.tree.get_command("onboard-server")
@@ -278,7 +292,8 @@ async def update_onboard_command_visibility(bot: 'AntiScamBot', guild: discord.G
                 logger.warning(f"Cannot hide /onboard-server in {guild.name} because bot_owner_id is not set.")
                 return
             permissions = {discord.Object(id=owner_id): True}
-            await bot.tree.edit_command_permissions(guild=guild, command=onboard_command, permissions=permissions)
+            if not await _apply_onboard_permissions(bot, guild, onboard_command, permissions):
+                return
             logger.info(f"Hid '/onboard-server' for non-owners in synced guild {guild.name}.")
         else:
             mod_role_ids = bot.config.get("moderator_roles_per_guild", {}).get(str(guild.id), [])
@@ -292,7 +307,8 @@ async def update_onboard_command_visibility(bot: 'AntiScamBot', guild: discord.G
             if not permissions:
                 logger.warning(f"No moderator roles configured for {guild.name}, /onboard-server will be hidden.")
 
-            await bot.tree.edit_command_permissions(guild=guild, command=onboard_command, permissions=permissions)
+            if not await _apply_onboard_permissions(bot, guild, onboard_command, permissions):
+                return
             logger.info(f"Set visibility for '/onboard-server' for moderators in unsynced guild {guild.name}.")
     except Exception as e:
         logger.error(f"Failed to update visibility for /onboard-server in {guild.name}: {e}", exc_info=True)
@@ -2,107 +2,311 @@
 
 import discord
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Optional
 import asyncio
+from collections import Counter
 import data_manager
 from config import logger
+from utils.helpers import NON_MEMBER_BAN_LIMIT_CODE, DynamicConcurrency, acquire_channel_send, bot_can_ban_in, call_with_retries, get_delete_seconds_for_guild, mark_ban_permission_missing
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
 
 # /antiscam/utils/federation_handler.py
 
-async def _ban_single_guild(bot, guild_id, user_to_ban, origin_guild, reason, detailed_reason_field, stats, current_month_key, is_proactive_command, moderator, semaphore):
-    """Helper function to handle the ban logic for a single guild with rate limiting and retries."""
-    
-    async with semaphore:
-        target_guild = bot.get_guild(guild_id)
-        if not target_guild:
+# Ban alerts for the same mod channel that arrive within this window are coalesced.
+ALERT_DIGEST_DELAY_SECONDS = 0.5
+# Max users listed in one digest embed; a chunk also ends early if its description would exceed
+# EMBED_DESCRIPTION_LIMIT (long user and guild names make each line up to ~200 characters).
+ALERT_DIGEST_MAX_USERS = 25
+# Discord rejects embeds with a description longer than this.
+EMBED_DESCRIPTION_LIMIT = 4096
+# Discord rejects embeds with a field value longer than this.
+EMBED_FIELD_VALUE_LIMIT = 1024
+# Guilds one federated action works on at once.
+PROPAGATION_CONCURRENCY = 25
+# Ban/unban requests in flight per guild, shared by all concurrent federated actions
+# (Discord's ban rate limit is per guild, so more than this just queues up 429s).
+# A guild's limit drops by one on each rate limit and recovers after a run of successes.
+GUILD_ACTION_CONCURRENCY = 3
+
+# channel_id -> queued (channel, embed, view, allowed_mentions, digest_line) tuples
+_pending_ban_alerts: dict[int, list[tuple]] = {}
+# Strong references so background alert tasks aren't garbage collected mid-flight
+_alert_tasks: set[asyncio.Task] = set()
+# The running ban-list warm-up, kept referenced so it isn't garbage collected mid-run
+_ban_cache_task: Optional[asyncio.Task] = None
+# guild_id -> (user_id, is_banned) changes seen while that guild's ban list is being read
+_ban_changes_during_read: dict[int, list[tuple[int, bool]]] = {}
+
+# ui.views imports this module at load time, so the view class is resolved on first use.
+_FederatedAlertView = None
+
+# Outcomes a ban propagation can have in one guild; only BAN_BANNED counts toward stats.
+BAN_BANNED = "banned"
+BAN_ALREADY_BANNED = "already_banned"
+BAN_FORBIDDEN = "forbidden"
+BAN_FAILED = "failed"
+
+class BanResult(NamedTuple):
+    """What happened when propagating a ban to one guild."""
+    guild_id: int
+    status: str
+    error: Optional[BaseException] = None
+
+def _federated_alert_view_class():
+    global _FederatedAlertView
+    if _FederatedAlertView is None:
+        from ui.views import FederatedAlertView
+        _FederatedAlertView = FederatedAlertView
+    return _FederatedAlertView
+
+def _spawn_alert_task(coro):
+    """Runs an alert send in the background; propagation never waits on Discord's send latency."""
+    task = asyncio.create_task(coro)
+    _alert_tasks.add(task)
+    task.add_done_callback(_alert_tasks.discard)
+
+def _queue_ban_alert(bot, mod_channel, alert_embed, view, allowed_mentions, digest_line):
+    """Queues a ban alert; the first alert for a channel schedules the drain for its window."""
+    pending = _pending_ban_alerts.setdefault(mod_channel.id, [])
+    pending.append((mod_channel, alert_embed, view, allowed_mentions, digest_line))
+    if len(pending) == 1:
+        _spawn_alert_task(_drain_ban_alerts(bot, mod_channel.id))
+
+async def _drain_ban_alerts(bot, channel_id):
+    """
+    Sends the alerts queued for a channel. A lone alert goes out as-is, with its Unban Locally
+    button; a raid-sized burst is collapsed into digest embeds listing the banned users.
+    """
+    await asyncio.sleep(ALERT_DIGEST_DELAY_SECONDS)
+    batch = _pending_ban_alerts.pop(channel_id, [])
+    if not batch:
+        return
+    mod_channel = batch[0][0]
+
+    try:
+        if len(batch) == 1:
+            _, alert_embed, view, allowed_mentions, _ = batch[0]
+            await acquire_channel_send(bot, channel_id)
+            await mod_channel.send(embed=alert_embed, view=view, allowed_mentions=allowed_mentions)
             return
 
+        header = "**Action:** Automatically banned from this server.\n"
+        for chunk in _digest_chunks([entry[4] for entry in batch], EMBED_DESCRIPTION_LIMIT - len(header)):
+            digest_embed = discord.Embed(
+                title=f"🛡️ {len(chunk)} Federated Bans Received",
+                description=header + "".join("\n" + line for line in chunk),
+                color=discord.Color.dark_red(),
+                timestamp=datetime.now(timezone.utc)
+            )
+            digest_embed.set_footer(text="Grouped during a ban wave. Use the server ban list to reverse individual bans.")
+            await acquire_channel_send(bot, channel_id)
+            await mod_channel.send(embed=digest_embed, allowed_mentions=discord.AllowedMentions.none())
+    except Exception as e:
+        logger.error(f"Failed to send federated ban alert(s) to channel {channel_id}: {e}")
+
+def _digest_chunks(lines, budget):
+    """Splits digest lines into chunks of at most ALERT_DIGEST_MAX_USERS lines, each chunk fitting the character budget (one newline per line)."""
+    chunk, size = [], 0
+    for line in lines:
+        if len(line) + 1 > budget:
+            line = line[:budget - 2] + "…"
+        if chunk and (len(chunk) >= ALERT_DIGEST_MAX_USERS or size + len(line) + 1 > budget):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(line)
+        size += len(line) + 1
+    if chunk:
+        yield chunk
+
+def _record_guild_action(stats, guild_id_str, lifetime_key, monthly_key, current_month_key):
+    """Increments a guild's lifetime counter and its counter for the current month."""
+    guild_stats = stats[guild_id_str]
+    guild_stats[lifetime_key] += 1
+    monthly = guild_stats.get(monthly_key)
+    if monthly is None:
+        monthly = guild_stats[monthly_key] = Counter()
+    monthly[current_month_key] += 1
+
+def _retract_received_ban(stats, guild_id_str):
+    """Takes back one received ban after a federated unban, never going below zero."""
+    guild_stats = stats[guild_id_str]
+    if guild_stats["bans_received_lifetime"] > 0:
+        guild_stats["bans_received_lifetime"] -= 1
+
+def _record_federated_action(stats):
+    stats["global"]["total_federated_actions_lifetime"] += 1
+
+def _fit_field_value(value):
+    """Truncates an embed field value to Discord's limit, keeping a trailing code fence intact."""
+    if len(value) <= EMBED_FIELD_VALUE_LIMIT:
+        return value
+    suffix = "...```" if value.endswith("```") else "..."
+    return value[:EMBED_FIELD_VALUE_LIMIT - len(suffix)] + suffix
+
+def _guild_action_limiter(bot, guild_id):
+    limiter = bot.guild_action_limiters.get(guild_id)
+    if limiter is None:
+        limiter = bot.guild_action_limiters[guild_id] = DynamicConcurrency(GUILD_ACTION_CONCURRENCY)
+    return limiter
+
+def _federated_target_guilds(bot):
+    """Resolves the federated guilds the bot can currently see; the origin guild is included."""
+    return [guild for guild_id in bot.config.get("federated_guild_ids", []) if (guild := bot.get_guild(guild_id))]
+
+async def _completed_results(tasks, action_label):
+    """Yields each propagation task's result as it finishes, skipping empty ones and logging any task that raised."""
+    for next_done in asyncio.as_completed(tasks):
         try:
-            await target_guild.fetch_ban(user_to_ban)
-            logger.info(f"User {user_to_ban.name} already banned in target {target_guild.name}.")
-        except discord.NotFound:
-            # Retry Logic
-            for attempt in range(3):
-                try:
-                    fed_reason = f"Federated ban from {origin_guild.name}. Reason: {reason}"
-                    
-                    if is_proactive_command and target_guild.id == origin_guild.id:
-                        fed_reason = f"Proactive ban initiated by {moderator.name}. Reason: {reason}"
-
-                    from utils.helpers import get_delete_days_for_guild
-                    delete_seconds = get_delete_days_for_guild(bot, target_guild) * 86400
-                    
-                    await target_guild.ban(user_to_ban, reason=fed_reason[:512], delete_message_seconds=delete_seconds)
-                    logger.info(f"SUCCESS: Banned {user_to_ban.name} from {target_guild.name}.")
-
-                    # Send alert (Alert code remains the same...)
-                    mod_channel_id = bot.config.get("federation_notice_channels", {}).get(str(target_guild.id))
-                    if mod_channel_id and (mod_channel := bot.get_channel(mod_channel_id)):
-                        from ui.views import FederatedAlertView
-                        alert_embed = discord.Embed(
-                            title="🛡️ Federated Ban Received",
-                            description=f"**User:** {user_to_ban.name} ({user_to_ban.mention}, `{user_to_ban.id}`)\n"
-                                        f"**Action:** Automatically banned from this server.\n"
-                                        f"**Origin:** **{origin_guild.name}**",
-                            color=discord.Color.dark_red(),
-                            timestamp=datetime.now(timezone.utc)
-                        )
-                        alert_embed.add_field(name=detailed_reason_field["name"], value=detailed_reason_field["value"], inline=False)
-                        alert_embed.set_author(name=user_to_ban.name, icon_url=user_to_ban.display_avatar.url)
-                        alert_embed.set_footer(text=f"User ID: {user_to_ban.id}")
-                        view = FederatedAlertView(banned_user_id=user_to_ban.id)
-                        allowed_mentions = discord.AllowedMentions(users=[user_to_ban])
-                        await mod_channel.send(embed=alert_embed, view=view, allowed_mentions=allowed_mentions)
-                    
-                    return target_guild.id # Success!
-
-                except discord.DiscordServerError as e:
-                    # 503s and other server errors. Wait and retry.
-                    if attempt < 2:
-                        logger.warning(f"Discord Server Error banning in {target_guild.name} (Attempt {attempt+1}/3): {e}. Retrying...")
-                        await asyncio.sleep(1 + attempt)
-                        continue
-                    return None
-                
-                # <<< START OF FIX >>>
-                except discord.HTTPException as e:
-                    # Handle Rate Limit for Non-Members (30035)
-                    if e.code == 30035:
-                        if attempt < 2:
-                            logger.warning(f"Hit Non-Member Ban Limit in {target_guild.name} for {user_to_ban.id}. Cooling down for 30s...")
-                            await asyncio.sleep(30)
-                            continue
-                        else:
-                            logger.error(f"Failed to ban in {target_guild.name} due to rate limit after retries: {e}")
-                            return None
-                    
-                    # 429s are handled by the library mostly, but if we catch one:
-                    if e.status == 429:
-                         await asyncio.sleep(2)
-                         continue
-                    
-                    # Other HTTP errors (e.g. Missing Permissions) should fail immediately
-                    logger.error(f"HTTP Error banning in {target_guild.name}: {e}")
-                    return None
-                # <<< END OF FIX >>>
-
-                except Exception as e:
-                    logger.error(f"Unexpected error banning in {target_guild.name}: {e}", exc_info=True)
-                    return None
+            result = await next_done
+        except Exception as e:
+            logger.error(f"Unexpected error during federated {action_label} propagation: {e}")
+            continue
+        if result:
+            yield result
 
+async def _send_origin_confirmation(bot, origin_guild, embed, action_label):
+    """Tells the origin server's notice channel that a manual action was broadcast."""
+    origin_mod_channel_id = bot.config.get("federation_notice_channel_per_guild", {}).get(origin_guild.id)
+    if origin_mod_channel_id and (origin_mod_channel := bot.get_channel(origin_mod_channel_id)):
+        try:
+            await acquire_channel_send(bot, origin_mod_channel.id)
+            await origin_mod_channel.send(embed=embed)
+        except Exception as e:
+            logger.error(f"Failed to send manual {action_label} confirmation to {origin_guild.name}: {e}")
+
+def restart_ban_cache(bot):
+    """
+    Drops every cached ban list and reads them again in the background. Called on each on_ready:
+    ban and unban events missed while disconnected would otherwise leave the cached sets stale.
+    """
+    global _ban_cache_task
+    if _ban_cache_task is not None and not _ban_cache_task.done():
+        _ban_cache_task.cancel()
+    bot.banned_ids_per_guild.clear()
+    _ban_changes_during_read.clear()
+    _ban_cache_task = asyncio.create_task(_warm_ban_cache(bot))
+
+def note_ban_change(bot, guild_id, user_id, is_banned):
+    """Applies a ban or unban event to the guild's cached ban list, including one that is still being read."""
+    changes = _ban_changes_during_read.get(guild_id)
+    if changes is not None:
+        changes.append((user_id, is_banned))
+    banned_ids = bot.banned_ids_per_guild.get(guild_id)
+    if banned_ids is None:
+        return
+    if is_banned:
+        banned_ids.add(user_id)
+    else:
+        banned_ids.discard(user_id)
+
+async def _warm_ban_cache(bot):
+    """Reads each federated guild's ban list once so propagation can check bans in memory."""
+    for guild in bot.guilds:
+        if guild.id not in bot.config.get("federated_guild_id_set", frozenset()) or guild.id in bot.banned_ids_per_guild:
+            continue
+        changes = _ban_changes_during_read[guild.id] = []
+        try:
+            banned_ids = {ban.user.id async for ban in guild.bans(limit=None)}
+            # Events that arrived while paging are newer than the page they raced with, so replay them in order.
+            for user_id, is_banned in changes:
+                if is_banned:
+                    banned_ids.add(user_id)
+                else:
+                    banned_ids.discard(user_id)
+            # Assigned only once complete; a partial set would be mistaken for the full ban list.
+            bot.banned_ids_per_guild[guild.id] = banned_ids
         except discord.Forbidden:
+            logger.warning(f"Missing permissions to read bans in {guild.name}; falling back to per-user checks.")
+        except Exception as e:
+            logger.error(f"Failed to cache ban list for {guild.name}: {e}", exc_info=True)
+        finally:
+            # A restart may already have replaced this buffer with its own.
+            if _ban_changes_during_read.get(guild.id) is changes:
+                del _ban_changes_during_read[guild.id]
+    logger.info(f"Cached ban lists for {len(bot.banned_ids_per_guild)} guild(s).")
+
+async def _is_already_banned(bot, target_guild, user, allow_fetch=True):
+    """Checks whether a user is banned in a guild, skipping the HTTP probe when the answer is already known."""
+    # A user in the member cache is in the guild right now, so they can't be on its ban list.
+    if target_guild.get_member(user.id) is not None:
+        return False
+    banned_ids = bot.banned_ids_per_guild.get(target_guild.id)
+    if banned_ids is not None:
+        return user.id in banned_ids
+    if not allow_fetch:
+        return False
+    try:
+        await target_guild.fetch_ban(user)
+        return True
+    except discord.NotFound:
+        return False
+
+async def _ban_single_guild(bot, target_guild, user_to_ban, audit_reason, base_alert_embed, allowed_mentions, digest_line, notice_channels, semaphore, skip_prefetch=False):
+    """Helper function to handle the ban logic for a single guild with rate limiting and retries. Returns a BanResult."""
+    
+    # Checked before queueing for a slot, so a guild we can't ban in costs nothing.
+    if not bot_can_ban_in(bot, target_guild):
+        logger.warning(f"Missing permissions to ban in {target_guild.name}.")
+        return BanResult(target_guild.id, BAN_FORBIDDEN)
+
+    limiter = _guild_action_limiter(bot, target_guild.id)
+    # Call-wide slot first, then the guild's: taking them in this order can't deadlock across calls.
+    async with semaphore, limiter:
+        try:
+            if await _is_already_banned(bot, target_guild, user_to_ban, allow_fetch=not skip_prefetch):
+                logger.info(f"User {user_to_ban.name} already banned in target {target_guild.name}.")
+                return BanResult(target_guild.id, BAN_ALREADY_BANNED)
+        except discord.Forbidden as e:
             logger.warning(f"Missing permissions to ban in {target_guild.name}.")
-            return None
-        
-    return None
+            mark_ban_permission_missing(bot, target_guild)
+            return BanResult(target_guild.id, BAN_FORBIDDEN, e)
+
+        delete_seconds = get_delete_seconds_for_guild(bot, target_guild)
+
+        try:
+            # Server errors, 429s and the non-member ban limit (30035) are retried inside the helper
+            await call_with_retries(
+                lambda: target_guild.ban(user_to_ban, reason=audit_reason, delete_message_seconds=delete_seconds),
+                f"banning {user_to_ban.id} in {target_guild.name}",
+                on_rate_limit=limiter.shrink,
+            )
+        except discord.Forbidden as e:
+            # Role hierarchy can block banning a member; for a non-member a 403 means the permission is gone.
+            if target_guild.get_member(user_to_ban.id) is None:
+                mark_ban_permission_missing(bot, target_guild)
+            logger.error(f"HTTP Error banning in {target_guild.name}: {e}")
+            return BanResult(target_guild.id, BAN_FORBIDDEN, e)
+        except discord.HTTPException as e:
+            if e.code == NON_MEMBER_BAN_LIMIT_CODE or e.status == 429:
+                logger.error(f"Failed to ban in {target_guild.name} due to rate limit after retries: {e}")
+            else:
+                logger.error(f"HTTP Error banning in {target_guild.name}: {e}")
+            return BanResult(target_guild.id, BAN_FAILED, e)
+        except Exception as e:
+            logger.error(f"Unexpected error banning in {target_guild.name}: {e}", exc_info=True)
+            return BanResult(target_guild.id, BAN_FAILED, e)
+
+        logger.info(f"SUCCESS: Banned {user_to_ban.name} from {target_guild.name}.")
+        await limiter.record_success()
+
+        mod_channel_id = notice_channels.get(target_guild.id)
+        if mod_channel_id and (mod_channel := bot.get_channel(mod_channel_id)):
+            # Each channel gets its own copy, so nothing downstream can change another guild's alert.
+            alert_embed = base_alert_embed.copy()
+            # The view keeps per-message state (disabled buttons), so each alert gets its own.
+            view = _federated_alert_view_class()(banned_user_id=user_to_ban.id)
+            _queue_ban_alert(bot, mod_channel, alert_embed, view, allowed_mentions, digest_line)
+
+        return BanResult(target_guild.id, BAN_BANNED)
 
 async def process_federated_ban(bot: 'AntiScamBot', origin_guild: discord.Guild, user_to_ban: discord.User, moderator: discord.User, reason: str, detailed_reason_field: dict, is_proactive_command: bool = False):
     """
     The single source of truth for processing, counting, and propagating a federated ban.
-    OPTIMIZED: Uses asyncio.gather for concurrent execution.
+    Guilds are banned concurrently (bounded by PROPAGATION_CONCURRENCY) and each one's
+    outcome is counted as it finishes via _completed_results, so stats are recorded
+    without waiting for the slowest guild.
     """
     if data_manager.is_user_whitelisted(user_to_ban.id, bot.config):
         logger.info(
@@ -111,7 +315,9 @@ async def process_federated_ban(bot: 'AntiScamBot', origin_guild: discord.Guild,
         return
 
     stats = await data_manager.load_fed_stats()
-    current_month_key = datetime.now(timezone.utc).strftime("%Y-%m")
+    # One timestamp for the whole action: DB record, stats month and every alert embed
+    now = datetime.now(timezone.utc)
+    current_month_key = now.strftime("%Y-%m")
 
     # 1. Update the master ban list (Same as before)
     await data_manager.db_add_ban(
@@ -121,78 +327,137 @@ async def process_federated_ban(bot: 'AntiScamBot', origin_guild: discord.Guild,
         origin_id=origin_guild.id,
         origin_name=origin_guild.name,
         mod_id=moderator.id,
-        timestamp=datetime.now(timezone.utc).isoformat()
+        timestamp=now.isoformat()
         # bio defaults to None, which is correct for a fresh ban
     )
     logger.info(f"Added {user_to_ban.name} to master ban list (DB) from {origin_guild.name}.")
 
     # 2. Update stats for the origin server (Same as before)
-    origin_guild_id_str = str(origin_guild.id)
-    guild_stats = stats.setdefault(origin_guild_id_str, {})
-    guild_stats["bans_initiated_lifetime"] = guild_stats.get("bans_initiated_lifetime", 0) + 1
-    monthly_initiated = guild_stats.setdefault("monthly_initiated", {})
-    monthly_initiated[current_month_key] = monthly_initiated.get(current_month_key, 0) + 1
-    
-    global_stats = stats.setdefault("global", {})
-    global_stats["total_federated_actions_lifetime"] = global_stats.get("total_federated_actions_lifetime", 0) + 1
+    _record_guild_action(stats, str(origin_guild.id), "bans_initiated_lifetime", "monthly_initiated", current_month_key)
+    _record_federated_action(stats)
+    data_manager.mark_fed_stats_dirty()
 
     # 3. Send confirmation message to the ORIGIN server (Same as before)
     if not is_proactive_command:
-        origin_mod_channel_id = bot.config.get("federation_notice_channels", {}).get(str(origin_guild.id))
-        if origin_mod_channel_id and (origin_mod_channel := bot.get_channel(origin_mod_channel_id)):
-            embed_desc = (
-                f"The manual for **{user_to_ban.name}** (`{user_to_ban.id}`) has been broadcast to all federated servers.\n\n"
-                f"**Reason:**\n```{reason[:1000]}```"
-            )
-            origin_alert_embed = discord.Embed(
-                title="✅ Manual Ban Propagated",
-                description=embed_desc,
-                color=discord.Color.blue(),
-                timestamp=datetime.now(timezone.utc)
-            )
-            try:
-                await origin_mod_channel.send(embed=origin_alert_embed)
-            except Exception as e:
-                logger.error(f"Failed to send manual ban confirmation to {origin_guild.name}: {e}")
+        embed_desc = (
+            f"The manual for **{user_to_ban.name}** (`{user_to_ban.id}`) has been broadcast to all federated servers.\n\n"
+            f"**Reason:**\n```{reason[:1000]}```"
+        )
+        origin_alert_embed = discord.Embed(
+            title="✅ Manual Ban Propagated",
+            description=embed_desc,
+            color=discord.Color.blue(),
+            timestamp=now
+        )
+        _spawn_alert_task(_send_origin_confirmation(bot, origin_guild, origin_alert_embed, "ban"))
 
     # 4. Propagate the ban to other federated servers CONCURRENTLY
-    semaphore = asyncio.Semaphore(10) 
+    semaphore = asyncio.Semaphore(PROPAGATION_CONCURRENCY) 
+
+    # Resolve the target guilds once; guilds the bot can't see are dropped before any task is made
+    target_guilds = _federated_target_guilds(bot)
+
+    # Everything that is the same for every target is built once, not per guild/attempt
+    fed_reason = f"Federated ban from {origin_guild.name}. Reason: {reason}"[:512]
+    notice_channels = bot.config.get("federation_notice_channel_per_guild", {})
+    proactive_reason = f"Proactive ban initiated by {moderator.name}. Reason: {reason}"[:512]
+    allowed_mentions = discord.AllowedMentions(users=[user_to_ban])
+    digest_line = f"• **{user_to_ban.name}** ({user_to_ban.mention}, `{user_to_ban.id}`) from **{origin_guild.name}**"
+    base_alert_embed = discord.Embed(
+        title="🛡️ Federated Ban Received",
+        description=f"**User:** {user_to_ban.name} ({user_to_ban.mention}, `{user_to_ban.id}`)\n"
+                    f"**Action:** Automatically banned from this server.\n"
+                    f"**Origin:** **{origin_guild.name}**",
+        color=discord.Color.dark_red(),
+        timestamp=now
+    )
+    base_alert_embed.add_field(name=detailed_reason_field["name"], value=_fit_field_value(detailed_reason_field["value"]), inline=False)
+    base_alert_embed.set_author(name=user_to_ban.name, icon_url=user_to_ban.display_avatar.url)
+    base_alert_embed.set_footer(text=f"User ID: {user_to_ban.id}")
 
     # Create a list of tasks
     tasks = []
-    for guild_id in bot.config.get("federated_guild_ids", []):
+    for target_guild in target_guilds:
         # Note: We are NOT filtering out the origin_guild here anymore, per the previous bug fix.
-        # The helper handles the logic.
+        # A proactive command bans in the origin guild too, with its own audit reason.
+        is_proactive_origin = is_proactive_command and target_guild.id == origin_guild.id
+        audit_reason = proactive_reason if is_proactive_origin else fed_reason
+        # A proactive ban hasn't happened at the origin yet, so probing its ban list over HTTP is wasted;
+        # banning an already-banned user is harmless anyway.
         task = _ban_single_guild(
-            bot, guild_id, user_to_ban, origin_guild, reason, detailed_reason_field, 
-            stats, current_month_key, is_proactive_command, moderator,
-            semaphore
+            bot, target_guild, user_to_ban, audit_reason, base_alert_embed,
+            allowed_mentions, digest_line, notice_channels, semaphore,
+            skip_prefetch=is_proactive_origin
         )
         tasks.append(task)
 
-    # Run all tasks at once
-    results = await asyncio.gather(*tasks)
+    # 5. Run all tasks at once and count each guild as soon as its ban lands; a slow retry
+    # elsewhere doesn't hold the stats back, and one guild blowing up doesn't lose the others
+    outcomes = Counter()
+    async for result in _completed_results(tasks, "ban"):
+        outcomes[result.status] += 1
+        # Guilds that already had the user banned aren't counted again
+        if result.status == BAN_BANNED:
+            _record_guild_action(stats, str(result.guild_id), "bans_received_lifetime", "monthly_received", current_month_key)
+            data_manager.mark_fed_stats_dirty()
+
+    summary = ", ".join(f"{count} {status}" for status, count in outcomes.items()) or "no target guilds"
+    logger.info(f"Federated ban of {user_to_ban.name} finished: {summary}.")
+
+
+async def _send_unban_alert(bot, mod_channel, alert_embed, target_guild):
+    try:
+        await acquire_channel_send(bot, mod_channel.id)
+        await mod_channel.send(embed=alert_embed)
+    except Exception as e:
+        logger.error(f"Failed to send federated unban alert to {target_guild.name}: {e}")
+
+async def _unban_single_guild(bot, target_guild, user_to_unban, audit_reason, base_alert_embed, notice_channels, semaphore):
+    """Helper function to handle the unban logic for a single guild. Returns the guild ID on success."""
+
+    if not bot_can_ban_in(bot, target_guild):
+        logger.error(f"Failed to unban {user_to_unban.name} in {target_guild.name} - Missing Permissions.")
+        return None
+
+    limiter = _guild_action_limiter(bot, target_guild.id)
+    async with semaphore, limiter:
+        description = f"unbanning {user_to_unban.id} in {target_guild.name}"
+        try:
+            # unban() answers NotFound for a user who isn't banned, so it is its own check. The cached
+            # ban list is not consulted: if it missed a ban event, skipping here would leave the user banned.
+            await call_with_retries(
+                lambda: target_guild.unban(user_to_unban, reason=audit_reason),
+                description,
+                on_rate_limit=limiter.shrink,
+            )
+        except discord.NotFound:
+            logger.info(f"User {user_to_unban.name} was not banned in {target_guild.name}, skipping unban.")
+            return None
+        except discord.Forbidden:
+            logger.error(f"Failed to unban {user_to_unban.name} in {target_guild.name} - Missing Permissions.")
+            mark_ban_permission_missing(bot, target_guild)
+            return None
+        except discord.HTTPException as e:
+            logger.error(f"Error during federated unban propagation to {target_guild.name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error during federated unban propagation to {target_guild.name}: {e}", exc_info=True)
+            return None
 
-    # 5. Process results to update stats
-    # results contains a list of guild IDs where a ban was successfully applied
-    for guild_id_banned in results:
-        if guild_id_banned:
-            target_guild_id_str = str(guild_id_banned)
-            target_stats = stats.setdefault(target_guild_id_str, {})
-            target_stats["bans_received_lifetime"] = target_stats.get("bans_received_lifetime", 0) + 1
-            monthly_received = target_stats.setdefault("monthly_received", {})
-            monthly_received[current_month_key] = monthly_received.get(current_month_key, 0) + 1
+        logger.info(f"SUCCESS: Unbanned {user_to_unban.name} from {target_guild.name}.")
+        await limiter.record_success()
 
-    await data_manager.save_fed_stats(stats)
+        # Send alert to the target guild
+        mod_channel_id = notice_channels.get(target_guild.id)
+        if mod_channel_id and (mod_channel := bot.get_channel(mod_channel_id)):
+            _spawn_alert_task(_send_unban_alert(bot, mod_channel, base_alert_embed.copy(), target_guild))
 
+        return target_guild.id
 
 async def process_federated_unban(bot: 'AntiScamBot', origin_guild: discord.Guild, user_to_unban: discord.User, moderator: discord.User, reason: str, is_proactive_command: bool = False):
     """
     The single source of truth for processing, counting, and propagating a federated unban.
     """
-    stats = await data_manager.load_fed_stats()
-    current_month_key = datetime.now(timezone.utc).strftime("%Y-%m")
-
     # Check if they exist first (to maintain the logic of "don't unban if not on list")
     existing_ban = await data_manager.db_get_ban(user_to_unban.id)
     
@@ -203,71 +468,50 @@ async def process_federated_unban(bot: 'AntiScamBot', origin_guild: discord.Guil
         logger.warning(f"Tried to process global unban for {user_to_unban.name}, but they were not on the master list.")
         return
 
-    # Update stats for the origin server and global count
-    origin_guild_id_str = str(origin_guild.id)
-    guild_stats = stats.setdefault(origin_guild_id_str, {})
-    guild_stats["unbans_initiated_lifetime"] = guild_stats.get("unbans_initiated_lifetime", 0) + 1
-    monthly_unbanned = guild_stats.setdefault("monthly_unbanned", {})
-    monthly_unbanned[current_month_key] = monthly_unbanned.get(current_month_key, 0) + 1
-    
-    global_stats = stats.setdefault("global", {})
-    global_stats["total_federated_actions_lifetime"] = global_stats.get("total_federated_actions_lifetime", 0) + 1
+    stats = await data_manager.load_fed_stats()
+    now = datetime.now(timezone.utc)
+    current_month_key = now.strftime("%Y-%m")
 
-    if not is_proactive_command:
-        origin_mod_channel_id = bot.config.get("federation_notice_channels", {}).get(str(origin_guild.id))
-        if origin_mod_channel_id and (origin_mod_channel := bot.get_channel(origin_mod_channel_id)):
-            embed_desc = (
-                f"The manual unban by {moderator.mention} for **{user_to_unban.name}** (`{user_to_unban.id}`) has been broadcast to all federated servers.\n\n"
-                f"**Reason:**\n```{reason[:1000]}```"
-            )
-            origin_alert_embed = discord.Embed(
-                title="✅ Manual Unban Propagated",
-                description=embed_desc,
-                color=discord.Color.light_grey(),
-                timestamp=datetime.now(timezone.utc)
-            )
-            try:
-                await origin_mod_channel.send(embed=origin_alert_embed)
-            except Exception as e:
-                logger.error(f"Failed to send manual unban confirmation to {origin_guild.name}: {e}")
-                
-    # Propagate the unban
-    for guild_id in bot.config.get("federated_guild_ids", []):        
-        target_guild = bot.get_guild(guild_id)
-        if not target_guild:
-            continue
+    # Update stats for the origin server and global count
+    _record_guild_action(stats, str(origin_guild.id), "unbans_initiated_lifetime", "monthly_unbanned", current_month_key)
+    _record_federated_action(stats)
+    data_manager.mark_fed_stats_dirty()
 
-        try:
-            await target_guild.fetch_ban(user_to_unban)
-            fed_reason = f"Federated unban from {origin_guild.name}. Reason: {reason}"
-            await target_guild.unban(user_to_unban, reason=fed_reason[:512])
-            logger.info(f"SUCCESS: Unbanned {user_to_unban.name} from {target_guild.name}.")
-
-            # Update stats for the receiving server
-            target_guild_id_str = str(target_guild.id)
-            target_stats = stats.setdefault(target_guild_id_str, {})
-            target_stats["bans_received_lifetime"] = max(0, target_stats.get("bans_received_lifetime", 0) - 1)
-
-            # Send alert to the target guild
-            mod_channel_id = bot.config.get("federation_notice_channels", {}).get(str(target_guild.id))
-            if mod_channel_id and (mod_channel := bot.get_channel(mod_channel_id)):
-                alert_embed = discord.Embed(
-                    title="ℹ️ Federated Unban Received",
-                    description=f"**User:** {user_to_unban.name} (`{user_to_unban.id}`)\n"
-                                f"**Action:** Automatically unbanned from this server.\n"
-                                f"**Origin:** **{origin_guild.name}**",
-                    color=discord.Color.green(),
-                    timestamp=datetime.now(timezone.utc)
-                )
-                alert_embed.add_field(name="Reason", value=f"```{reason}```", inline=False)
-                alert_embed.set_footer(text=f"User ID: {user_to_unban.id}")
-                await mod_channel.send(embed=alert_embed)
+    # One display-length copy of the reason serves the origin confirmation and every guild's alert
+    reason_field_value = f"```{reason[:1000]}```"
 
-        except discord.NotFound:
-            logger.info(f"User {user_to_unban.name} was not banned in {target_guild.name}, skipping unban.")
-        except discord.Forbidden:
-            logger.error(f"Failed to unban {user_to_unban.name} in {target_guild.name} - Missing Permissions.")
-        except Exception as e:
-            logger.error(f"Error during federated unban propagation to {target_guild.name}: {e}", exc_info=True)
+    if not is_proactive_command:
+        embed_desc = (
+            f"The manual unban by {moderator.mention} for **{user_to_unban.name}** (`{user_to_unban.id}`) has been broadcast to all federated servers.\n\n"
+            f"**Reason:**\n{reason_field_value}"
+        )
+        origin_alert_embed = discord.Embed(
+            title="✅ Manual Unban Propagated",
+            description=embed_desc,
+            color=discord.Color.light_grey(),
+            timestamp=now
+        )
+        _spawn_alert_task(_send_origin_confirmation(bot, origin_guild, origin_alert_embed, "unban"))
 
-    await data_manager.save_fed_stats(stats)
+    # Propagate the unban to all federated servers CONCURRENTLY
+    semaphore = asyncio.Semaphore(PROPAGATION_CONCURRENCY)
+    target_guilds = _federated_target_guilds(bot)
+    fed_reason = f"Federated unban from {origin_guild.name}. Reason: {reason}"[:512]
+    notice_channels = bot.config.get("federation_notice_channel_per_guild", {})
+    base_alert_embed = discord.Embed(
+        title="ℹ️ Federated Unban Received",
+        description=f"**User:** {user_to_unban.name} (`{user_to_unban.id}`)\n"
+                    f"**Action:** Automatically unbanned from this server.\n"
+                    f"**Origin:** **{origin_guild.name}**",
+        color=discord.Color.green(),
+        timestamp=now
+    )
+    base_alert_embed.add_field(name="Reason", value=reason_field_value, inline=False)
+    base_alert_embed.set_footer(text=f"User ID: {user_to_unban.id}")
+    tasks = [
+        _unban_single_guild(bot, target_guild, user_to_unban, fed_reason, base_alert_embed, notice_channels, semaphore)
+        for target_guild in target_guilds
+    ]
+    async for guild_id_unbanned in _completed_results(tasks, "unban"):
+        _retract_received_ban(stats, str(guild_id_unbanned))
+        data_manager.mark_fed_stats_dirty()
@@ -1,22 +1,35 @@
 # /antiscam/utils/helpers.py
 
 import discord
-from typing import TYPE_CHECKING
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, TypeVar
+
+from config import logger
 
 if TYPE_CHECKING:
     from antiscam import AntiScamBot
 
 
 AUDIT_REASON_LIMIT = 512
+RATE_LIMIT_MAX_RETRIES = 5
+# Longest we'll honor a server-provided retry delay before retrying anyway.
+RETRY_AFTER_MAX_SECONDS = 60.0
+# Discord error code for "max number of bans for non-guild members exceeded"; clears after a cooldown.
+NON_MEMBER_BAN_LIMIT_CODE = 30035
+NON_MEMBER_BAN_COOLDOWN_SECONDS = 30.0
+
+T = TypeVar("T")
 
 def get_timeout_minutes_for_guild(bot: 'AntiScamBot', guild: discord.Guild) -> int:
-    """Gets the configured timeout duration in minutes for a specific guild."""
+    """Gets the configured timeout duration in minutes for a specific guild, precomputed at config load."""
     config = bot.config
-    per_guild_settings = config.get("timeout_duration_minutes_per_guild", {})
-    guild_id_str = str(guild.id)
-    if guild_id_str in per_guild_settings:
-        return per_guild_settings[guild_id_str]
-    
+    minutes = config.get("timeout_minutes_per_guild", {}).get(guild.id)
+    if minutes is not None:
+        return minutes
     return config.get("timeout_duration_minutes_default", 10)
 
 def get_delete_days_for_guild(bot: 'AntiScamBot', guild: discord.Guild) -> int:
@@ -29,8 +42,207 @@ def get_delete_days_for_guild(bot: 'AntiScamBot', guild: discord.Guild) -> int:
     
     return config.get("delete_messages_on_ban_days_default", 1)
 
+def get_delete_seconds_for_guild(bot: 'AntiScamBot', guild: discord.Guild) -> int:
+    """Gets the delete_message_seconds to use when banning in a guild, precomputed at config load."""
+    config = bot.config
+    seconds = config.get("delete_message_seconds_per_guild", {}).get(guild.id)
+    if seconds is not None:
+        return seconds
+    default_seconds = config.get("delete_message_seconds_default")
+    if default_seconds is not None:
+        return default_seconds
+    return get_delete_days_for_guild(bot, guild) * 86400
+
+
+def bot_can_ban_in(bot: 'AntiScamBot', guild: discord.Guild) -> bool:
+    """Whether the bot holds Ban Members in a guild, cached until its roles change."""
+    can_ban = bot.ban_permission_per_guild.get(guild.id)
+    if can_ban is None:
+        can_ban = bot.ban_permission_per_guild[guild.id] = guild.me.guild_permissions.ban_members
+    return can_ban
+
+
+def mark_ban_permission_missing(bot: 'AntiScamBot', guild: discord.Guild) -> None:
+    """Records a 403 from Discord so propagation skips the guild until its roles change."""
+    bot.ban_permission_per_guild[guild.id] = False
+
 
 def truncate_audit_reason(reason_text: str, limit: int = AUDIT_REASON_LIMIT) -> str:
     if len(reason_text) <= limit:
         return reason_text
     return reason_text[: limit - 16] + "...(truncated)"
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    """Parses a Retry-After value given either as seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+def calculate_backoff(attempt: int, base: float = 1.0, max_delay: float = 30.0) -> float:
+    """Exponential backoff with jitter, so tasks that failed together don't all retry in lockstep."""
+    return min(max_delay, base * (2 ** attempt)) * (0.5 + random.random())
+
+
+def get_retry_after_seconds(error: discord.HTTPException, attempt: int, fallback: Optional[float] = None) -> float:
+    """
+    Reads the delay Discord prescribes for a rate-limited request, capped at RETRY_AFTER_MAX_SECONDS.
+    Falls back to `fallback`, or jittered exponential backoff, when the error carries no usable delay.
+    """
+    retry_after = _parse_retry_after(getattr(error, "retry_after", None))
+    response = getattr(error, "response", None)
+    if retry_after is None and response is not None:
+        headers = response.headers
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = _parse_retry_after(headers.get("X-RateLimit-Reset-After"))
+    if retry_after is None:
+        retry_after = fallback if fallback is not None else calculate_backoff(attempt)
+    return min(max(retry_after, 0.1), RETRY_AFTER_MAX_SECONDS)
+
+
+async def call_with_backoff(action: Callable[[], Awaitable[T]], max_retries: int = RATE_LIMIT_MAX_RETRIES) -> T:
+    """
+    Awaits action(), retrying after the server-provided delay when Discord answers with a 429.
+    Any other error, or a 429 on the final attempt, is raised to the caller.
+    """
+    for attempt in range(max_retries):
+        try:
+            return await action()
+        except discord.HTTPException as e:
+            if e.status != 429 or attempt == max_retries - 1:
+                raise
+            await asyncio.sleep(get_retry_after_seconds(e, attempt))
+
+
+async def call_with_retries(
+    action: Callable[[], Awaitable[T]],
+    description: str,
+    attempts: int = 3,
+    on_rate_limit: Optional[Callable[[], None]] = None,
+) -> T:
+    """
+    Awaits action(), retrying the transient Discord failures: server errors after a jittered backoff,
+    429s and the non-member ban limit after the delay Discord prescribes. on_rate_limit is called
+    for every rate limit hit. Any other error, or a transient one on the final attempt, is raised.
+    """
+    for attempt in range(attempts):
+        try:
+            return await action()
+        except discord.DiscordServerError as e:
+            if attempt == attempts - 1:
+                raise
+            delay = calculate_backoff(attempt)
+            logger.warning(f"Discord Server Error {description} (Attempt {attempt+1}/{attempts}): {e}. Retrying in {delay:.1f}s...")
+        except discord.HTTPException as e:
+            is_ban_limit = e.code == NON_MEMBER_BAN_LIMIT_CODE
+            if e.status != 429 and not is_ban_limit:
+                raise
+            if on_rate_limit is not None:
+                on_rate_limit()
+            if attempt == attempts - 1:
+                raise
+            fallback = NON_MEMBER_BAN_COOLDOWN_SECONDS if is_ban_limit else calculate_backoff(attempt)
+            delay = get_retry_after_seconds(e, attempt, fallback=fallback)
+            logger.warning(f"Rate limited {description} (Attempt {attempt+1}/{attempts}). Cooling down for {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
+
+class ChannelTokenBucket:
+    """
+    Token bucket that paces sends to a single channel. Discord allows roughly 5 messages
+    per 5 seconds per channel; waiting here is cheaper than eating a 429 mid-propagation.
+    """
+    def __init__(self, rate: int = 5, per: float = 5.0):
+        self.rate = rate
+        self.per = per
+        self.allowance = float(rate)
+        self.last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # The lock makes waiters take tokens in arrival order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.allowance = min(self.rate, self.allowance + (now - self.last_check) * (self.rate / self.per))
+                self.last_check = now
+                if self.allowance >= 1.0:
+                    self.allowance -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.allowance) * (self.per / self.rate))
+
+
+class DynamicConcurrency:
+    """
+    Concurrency limit that, unlike asyncio.Semaphore, can be resized while in use. It shrinks
+    when Discord rate-limits us and grows back after a run of successful requests.
+    """
+    def __init__(self, limit: int, min_limit: int = 1, recover_after: int = 10):
+        self.max_limit = limit
+        self.limit = limit
+        self.min_limit = min_limit
+        self.recover_after = recover_after
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+    def shrink(self) -> None:
+        """Drops the limit by one (in-flight holders finish normally; new ones wait)."""
+        self._successes = 0
+        self.limit = max(self.min_limit, self.limit - 1)
+
+    async def record_success(self) -> None:
+        """Counts a successful request, growing the limit back by one after `recover_after` in a row."""
+        if self.limit >= self.max_limit:
+            return
+        self._successes += 1
+        if self._successes >= self.recover_after:
+            self._successes = 0
+            async with self._cond:
+                self.limit += 1
+                self._cond.notify_all()
+
+
+async def acquire_channel_send(bot: 'AntiScamBot', channel_id: int) -> None:
+    """Waits until the bot may send another message to the given channel."""
+    bucket = bot.channel_send_buckets.get(channel_id)
+    if bucket is None:
+        bucket = bot.channel_send_buckets[channel_id] = ChannelTokenBucket()
+    await bucket.acquire()
+
+
+async def ban_with_backoff(guild: discord.Guild, user: discord.abc.Snowflake, reason: str, delete_seconds: int, max_retries: int = RATE_LIMIT_MAX_RETRIES) -> None:
+    """Bans a user, honoring Retry-After on rate limits."""
+    await call_with_backoff(
+        lambda: guild.ban(user, reason=reason, delete_message_seconds=delete_seconds),
+        max_retries=max_retries,
+    )